@@ -16,6 +16,7 @@ import re
 sys.path.append(str(Path(__file__).parent / "src"))
 
 from mix_player import MixPlayer, WordMatch, ComposedSentence
+from script_utils import load_json
 
 
 @dataclass
@@ -88,13 +89,10 @@ class ChunkMixPlayer(MixPlayer):
                                 min_chunk_size: int, max_chunk_size: int,
                                 min_confidence: float) -> List[WordChunk]:
         """Extrait les chunks d'un fichier de transcription."""
-        import json
-        
         chunks = []
         
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json(json_path)
             
             file_name = data['metadata']['file']
             audio_path = data['metadata']['path']
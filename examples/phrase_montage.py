@@ -10,9 +10,10 @@ from pathlib import Path
 import json
 import re
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from pydub import AudioSegment
+import numpy as np
 import difflib
 import random
 import math
@@ -26,6 +27,9 @@ except ImportError:
     MUTAGEN_AVAILABLE = False
     print("⚠️ mutagen non disponible - métadonnées MP3 désactivées")
 
+# Type NumPy des échantillons PCM selon la largeur d'échantillon pydub
+PCM_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
 # Ajouter le répertoire src au path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
@@ -427,15 +431,26 @@ class PhraseSelector:
         
         print(f"🎬 Génération montage de {len(phrases)} phrases...")
         
-        # Créer le montage
-        final_audio = None
-        gap_silence = AudioSegment.silent(duration=int(gap_duration * 1000))  # ms
+        # Format commun du montage (comme pydub lors d'une concaténation)
+        sources = {p.audio_path: self._load_audio(p.audio_path) for p in phrases}
+        frame_rate = max(a.frame_rate for a in sources.values())
+        channels = max(a.channels for a in sources.values())
+        sample_width = max(a.sample_width for a in sources.values())
+        if sample_width not in PCM_DTYPES:
+            # 24 bits (3 octets) n'a pas de type NumPy : montage en 32 bits
+            sample_width = 4
+        audio_format = (frame_rate, channels, sample_width)
+        
+        gap_samples = np.zeros((int(gap_duration * frame_rate), channels),
+                               dtype=PCM_DTYPES[sample_width])
+        parts = []
         
         for i, phrase in enumerate(phrases, 1):
             print(f"  📝 {i}/{len(phrases)}: {phrase.text[:60]}...")
             
-            # Charger l'audio source
-            source_audio = self._load_audio(phrase.audio_path)
+            # PCM de l'audio source (décodé une seule fois par fichier)
+            source_pcm = self._load_pcm(phrase.audio_path, audio_format)
+            source_ms = len(source_pcm) * 1000 // frame_rate
             
             # Extraire la phrase (en millisecondes)
             start_ms = int(phrase.start * 1000)
@@ -453,11 +468,19 @@ class PhraseSelector:
                     duration_added = extended_end - phrase.end
                     print(f"      ↪️  +{include_next_phrases} phrase(s) suivante(s) du même intervenant (+{duration_added:.1f}s)")
                 else:
-                    end_ms = min(len(source_audio), end_ms + padding_ms)
+                    end_ms = min(source_ms, end_ms + padding_ms)
             else:
-                end_ms = min(len(source_audio), end_ms + padding_ms)
-            
-            phrase_audio = source_audio[start_ms:end_ms]
+                end_ms = min(source_ms, end_ms + padding_ms)
+            
+            # L'extension n'est qu'un autre index de fin dans le PCM en cache
+            start_sample = start_ms * frame_rate // 1000
+            end_sample = end_ms * frame_rate // 1000
+            phrase_audio = AudioSegment(
+                data=source_pcm[start_sample:end_sample].tobytes(),
+                sample_width=sample_width,
+                frame_rate=frame_rate,
+                channels=channels
+            )
             
             # Normaliser l'audio pour équilibrer les volumes
             if normalize and normalize != "none":
@@ -472,11 +495,17 @@ class PhraseSelector:
                 fade_out_ms = int(fade_out_duration * 1000)
                 phrase_audio = phrase_audio.fade_out(min(fade_out_ms, len(phrase_audio) // 4))
             
-            # Ajouter au montage
-            if final_audio is None:
-                final_audio = phrase_audio
-            else:
-                final_audio = final_audio + gap_silence + phrase_audio
+            # Ajouter au montage (une seule concaténation à la fin)
+            if parts:
+                parts.append(gap_samples)
+            parts.append(np.frombuffer(phrase_audio.raw_data, dtype=source_pcm.dtype).reshape(-1, channels))
+        
+        final_audio = AudioSegment(
+            data=np.concatenate(parts).tobytes(),
+            sample_width=sample_width,
+            frame_rate=frame_rate,
+            channels=channels
+        )
         
         # Sauvegarder
         output_path = Path(output_file)
@@ -504,6 +533,26 @@ class PhraseSelector:
         
         return self.audio_cache[audio_path]
     
+    def _load_pcm(self, audio_path: str, audio_format: Tuple[int, int, int]) -> np.ndarray:
+        """
+        Retourne le PCM (frames × canaux) d'un fichier source au format demandé.
+        
+        Vue sans copie sur l'audio en cache ; s'il faut le convertir, la version convertie
+        remplace l'originale dans le cache (une seule copie de chaque source en mémoire).
+        """
+        frame_rate, channels, sample_width = audio_format
+        audio = self._load_audio(audio_path)
+        if (audio.frame_rate, audio.channels, audio.sample_width) != audio_format:
+            if audio.frame_rate != frame_rate:
+                audio = audio.set_frame_rate(frame_rate)
+            if audio.channels != channels:
+                audio = audio.set_channels(channels)
+            if audio.sample_width != sample_width:
+                audio = audio.set_sample_width(sample_width)
+            self.audio_cache[audio_path] = audio
+        
+        return np.frombuffer(audio.raw_data, dtype=PCM_DTYPES[sample_width]).reshape(-1, channels)
+    
     def normalize_audio(self, audio: AudioSegment, method: str = "peak") -> AudioSegment:
         """Normalise l'audio selon différentes méthodes
         
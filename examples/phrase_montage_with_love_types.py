@@ -11,12 +11,17 @@ import json
 import re
 import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
+import numpy as np
 from pydub import AudioSegment
 import difflib
 import random
 import math
+import subprocess
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 try:
     from mutagen.mp3 import MP3
@@ -26,9 +31,75 @@ except ImportError:
     MUTAGEN_AVAILABLE = False
     print("⚠️ mutagen non disponible - métadonnées MP3 désactivées")
 
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
 # Ajouter le répertoire src au path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
+# Types d'amour reconnus par l'analyse sémantique
+AVAILABLE_LOVE_TYPES = frozenset({"romantique", "familial", "amical", "spirituel",
+                                  "erotique", "narcissique", "platonique", "compassionnel"})
+
+# Format PCM des extraits décodés par ffmpeg (16 bits signés)
+SLICE_FRAME_RATE = 44100
+SLICE_CHANNELS = 1
+SLICE_SAMPLE_WIDTH = 2
+
+# Nombre maximum d'extraits gardés en mémoire
+AUDIO_CACHE_SIZE = 32
+
+
+def _decode_slice(audio_path: str, start_ms: int, end_ms: int) -> bytes:
+    """Décode uniquement la fenêtre [start_ms, end_ms] d'un fichier audio via ffmpeg
+    
+    Returns:
+        Données PCM brutes (s16le, SLICE_FRAME_RATE Hz, SLICE_CHANNELS canal)
+    """
+    cmd = [
+        "ffmpeg", "-v", "error",
+        "-ss", f"{start_ms / 1000:.3f}",
+        "-to", f"{end_ms / 1000:.3f}",
+        "-i", str(audio_path),
+        "-f", "s16le",
+        "-ac", str(SLICE_CHANNELS),
+        "-ar", str(SLICE_FRAME_RATE),
+        "-",
+    ]
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+    return result.stdout
+
+
+def _export_mp3(audio: AudioSegment, output_path: str, bitrate: str = "192k"):
+    """Encode un segment en MP3 en envoyant directement le PCM brut à ffmpeg
+    
+    Évite le fichier WAV temporaire écrit puis relu par `AudioSegment.export`.
+    """
+    cmd = [
+        "ffmpeg", "-y", "-v", "error",
+        "-f", f"s{audio.sample_width * 8}le",
+        "-ar", str(audio.frame_rate),
+        "-ac", str(audio.channels),
+        "-i", "-",
+        "-b:a", bitrate,
+        "-threads", "0",
+        str(output_path),
+    ]
+    subprocess.run(cmd, input=audio.raw_data, stdout=subprocess.DEVNULL,
+                   stderr=subprocess.PIPE, check=True)
+
+
+@lru_cache(maxsize=16)
+def _fade_ramp(length: int) -> np.ndarray:
+    """Rampe linéaire 0 -> 1 de `length` trames, réutilisée entre les phrases"""
+    ramp = np.linspace(0.0, 1.0, length, dtype=np.float32)
+    ramp.setflags(write=False)
+    return ramp
+
+
 @dataclass
 class PhraseMatch:
     """Représente une phrase trouvée"""
@@ -46,6 +117,18 @@ class PhraseMatch:
 class PhraseSelector:
     """Sélecteur et monteur de phrases complètes avec support des types d'amour"""
     
+    # Emojis associés à chaque type d'amour
+    LOVE_EMOJIS = {
+        "romantique": "💕",
+        "familial": "👨‍👩‍👧‍👦", 
+        "amical": "🤝",
+        "spirituel": "🙏",
+        "erotique": "🔥",
+        "narcissique": "🪞",
+        "platonique": "📚",
+        "compassionnel": "🤗"
+    }
+    
     def __init__(self, transcription_dir: str = "output_transcription", 
                  semantic_dir: str = "output_semantic", 
                  audio_dir: str = "audio"):
@@ -53,8 +136,10 @@ class PhraseSelector:
         self.semantic_dir = Path(semantic_dir)
         self.audio_dir = Path(audio_dir)
         self.phrases: List[PhraseMatch] = []
-        self.audio_cache: Dict[str, AudioSegment] = {}
+        # Cache LRU borné des extraits décodés, clé (fichier, début ms, fin ms)
+        self.audio_cache: "OrderedDict[Tuple[str, int, int], AudioSegment]" = OrderedDict()
         self.semantic_data: Dict[str, Dict] = {}  # Cache pour les données sémantiques
+        self._love_index: Dict[Tuple[str, int], Optional[str]] = {}  # (fichier, segment) -> type dominant
         
     def load_phrases(self):
         """Charge toutes les phrases des transcriptions"""
@@ -84,26 +169,31 @@ class PhraseSelector:
                 print(f"⚠️ Erreur chargement sémantique {semantic_file.name}: {e}")
         
         print(f"📊 {len(self.semantic_data)} analyses sémantiques chargées")
+        self._build_love_index()
         self._enrich_phrases_with_love_types()
     
+    def _build_love_index(self):
+        """Indexe les types d'amour dominants par (nom de base, segment_id) en un seul parcours"""
+        self._love_index = {}
+        
+        for base_name, semantic_data in self.semantic_data.items():
+            segments = semantic_data.get('semantic_analysis', {}).get('segments', [])
+            for sem_segment in segments:
+                # Garder le premier segment rencontré pour un même identifiant
+                self._love_index.setdefault((base_name, sem_segment['segment_id']),
+                                            sem_segment.get('dominant_love_type'))
+    
     def _enrich_phrases_with_love_types(self):
         """Enrichit les phrases avec leurs types d'amour dominant"""
         enriched_count = 0
         
         for phrase in self.phrases:
             # Extraire le nom de base du fichier (sans extension)
-            base_name = phrase.file_name.replace(".mp3", "")
+            key = (phrase.file_name.replace(".mp3", ""), phrase.segment_id)
             
-            if base_name in self.semantic_data:
-                semantic_data = self.semantic_data[base_name]
-                
-                # Chercher le segment correspondant dans l'analyse sémantique
-                if 'semantic_analysis' in semantic_data and 'segments' in semantic_data['semantic_analysis']:
-                    for sem_segment in semantic_data['semantic_analysis']['segments']:
-                        if sem_segment['segment_id'] == phrase.segment_id:
-                            phrase.love_type = sem_segment.get('dominant_love_type')
-                            enriched_count += 1
-                            break
+            if key in self._love_index:
+                phrase.love_type = self._love_index[key]
+                enriched_count += 1
         
         print(f"💝 {enriched_count} phrases enrichies avec types d'amour")
         
@@ -157,52 +247,74 @@ class PhraseSelector:
             keywords: Liste de mots-clés à rechercher
             min_score: Score minimum pour considérer une phrase
             love_types: Liste optionnelle de types d'amour à filtrer
+            
+        Raises:
+            ValueError: Si un type d'amour demandé n'existe pas
         """
         matches = []
         
-        # Types d'amour disponibles pour référence
-        available_love_types = {"romantique", "familial", "amical", "spirituel", 
-                              "erotique", "narcissique", "platonique", "compassionnel"}
-        
         if love_types:
+            unknown_types = set(love_types) - AVAILABLE_LOVE_TYPES
+            if unknown_types:
+                raise ValueError(f"Types d'amour inconnus: {', '.join(sorted(unknown_types))}")
             print(f"💝 Filtrage par types d'amour: {', '.join(love_types)}")
         
+        # Préparer une seule fois les mots-clés et le filtre de types
+        keywords_lower = [(keyword, keyword.lower()) for keyword in keywords]
+        love_set = frozenset(love_types) if love_types else None
+        
         for phrase in self.phrases:
-            # Filtre par type d'amour si spécifié
-            if love_types and phrase.love_type:
-                if phrase.love_type not in love_types:
-                    continue
+            # Filtre par type d'amour si spécifié (les phrases non typées sont conservées)
+            if love_set is not None and phrase.love_type and phrase.love_type not in love_set:
+                continue
             
             # Recherche par mots-clés
             phrase_lower = phrase.text.lower()
+            words_in_phrase = None  # Découpage fait seulement si une recherche floue est nécessaire
             found_keywords = []
             score = 0.0
             
-            for keyword in keywords:
-                keyword_lower = keyword.lower()
-                
-                # Correspondance exacte
+            for keyword, keyword_lower in keywords_lower:
+                # Correspondance exacte : pas besoin de recherche floue
                 if keyword_lower in phrase_lower:
                     found_keywords.append(keyword)
                     score += 2.0
-                else:
-                    # Recherche floue avec difflib
+                    continue
+                
+                # Recherche floue (rapidfuzz si disponible, sinon difflib)
+                if words_in_phrase is None:
                     words_in_phrase = phrase_lower.split()
-                    best_match = difflib.get_close_matches(keyword_lower, words_in_phrase, 
-                                                         n=1, cutoff=0.7)
-                    if best_match:
-                        found_keywords.append(f"{keyword}≈{best_match[0]}")
-                        score += 1.5
+                best_match = self._closest_word(keyword_lower, words_in_phrase, cutoff=0.7)
+                if best_match:
+                    found_keywords.append(f"{keyword}≈{best_match}")
+                    score += 1.5
             
             if found_keywords and score >= min_score:
                 phrase.keywords_found = found_keywords
                 phrase.match_score = score
                 matches.append(phrase)
         
-        # Trier par score décroissant avec randomisation
-        matches.sort(key=lambda x: x.match_score + random.uniform(-0.2, 0.2), reverse=True)
+        if not matches:
+            return matches
+        
+        # Trier par score décroissant avec randomisation (vectorisé)
+        scores = np.fromiter((m.match_score for m in matches), dtype=np.float32, count=len(matches))
+        jitter = np.random.uniform(-0.2, 0.2, scores.size).astype(np.float32)
+        order = np.argsort(-(scores + jitter), kind="stable")
         
-        return matches
+        return [matches[i] for i in order]
+
+    def _closest_word(self, keyword: str, words: List[str], cutoff: float) -> Optional[str]:
+        """Retourne le mot le plus proche du mot-clé (similarité >= cutoff), ou None"""
+        if RAPIDFUZZ_AVAILABLE:
+            # Levenshtein bit-parallèle (Myers) en C++ ; fuzz.ratio suit l'échelle
+            # de SequenceMatcher.ratio multipliée par 100
+            best = fuzz_process.extractOne(keyword, words, scorer=fuzz.ratio,
+                                           score_cutoff=cutoff * 100)
+            return best[0] if best else None
+        
+        best_match = difflib.get_close_matches(keyword, words, n=1, cutoff=cutoff)
+        return best_match[0] if best_match else None
 
     def _diversify_sources(self, matches: List[PhraseMatch], target_count: int) -> List[PhraseMatch]:
         """Sélectionne les phrases en diversifiant les sources avec randomisation renforcée"""
@@ -215,7 +327,7 @@ class PhraseSelector:
             variation = random.uniform(-0.15, 0.15) * match.match_score
             match.match_score += variation
         
-        # Mélanger les candidats au sein de chaque niveau de qualité
+        # Répartir les candidats par niveau de qualité
         # Diviser en 3 tiers : excellent (60%), bon (30%), acceptable (10%)
         excellent_threshold = len(matches) * 0.6
         good_threshold = len(matches) * 0.9
@@ -224,26 +336,26 @@ class PhraseSelector:
         good_candidates = matches[int(excellent_threshold):int(good_threshold)]
         acceptable_candidates = matches[int(good_threshold):]
         
-        # Mélanger chaque groupe
-        random.shuffle(excellent_candidates)
-        random.shuffle(good_candidates)
-        random.shuffle(acceptable_candidates)
-        
         # Sélection stratifiée avec plus de variation
         selected = []
+        seen_ids = set()
         file_speaker_count = {}
         
-        # Pool combiné avec pondération
-        candidate_pool = (excellent_candidates * 3 +  # 3x plus de chances
-                         good_candidates * 2 +        # 2x plus de chances  
-                         acceptable_candidates)       # 1x chances
+        # Pool combiné avec pondération (tirage pondéré plutôt que duplication des listes)
+        candidate_pool = excellent_candidates + good_candidates + acceptable_candidates
+        weights = ([3] * len(excellent_candidates) +  # 3x plus de chances
+                   [2] * len(good_candidates) +       # 2x plus de chances
+                   [1] * len(acceptable_candidates))  # 1x chances
         
-        random.shuffle(candidate_pool)  # Mélange final
-        
-        for phrase in candidate_pool:
+        for phrase in random.choices(candidate_pool, weights=weights, k=target_count * 4):
             if len(selected) >= target_count:
                 break
-                
+            
+            # Le tirage est avec remise : ignorer les phrases déjà examinées
+            if id(phrase) in seen_ids:
+                continue
+            seen_ids.add(id(phrase))
+            
             file_speaker_key = f"{phrase.file_name}_{phrase.speaker}"
             current_count = file_speaker_count.get(file_speaker_key, 0)
             
@@ -254,7 +366,8 @@ class PhraseSelector:
         
         # Si pas assez trouvé, compléter sans restriction
         if len(selected) < target_count:
-            remaining_pool = [p for p in matches if p not in selected]
+            selected_ids = {id(p) for p in selected}
+            remaining_pool = [p for p in matches if id(p) not in selected_ids]
             random.shuffle(remaining_pool)
             selected.extend(remaining_pool[:target_count - len(selected)])
         
@@ -271,7 +384,7 @@ class PhraseSelector:
         
         for i, phrase in enumerate(matches[:20], 1):  # Limiter à 20 pour l'affichage
             duration = phrase.end - phrase.start
-            love_emoji = self._get_love_emoji(phrase.love_type)
+            love_emoji = self.LOVE_EMOJIS.get(phrase.love_type, "💖")
             love_display = f" {love_emoji} {phrase.love_type}" if phrase.love_type else ""
             
             print(f" {i:2d}. 📝 {phrase.text}")
@@ -280,20 +393,6 @@ class PhraseSelector:
             print(f"     ⏱️ {phrase.start:.1f}s - {phrase.end:.1f}s ({duration:.1f}s)")
             print()
 
-    def _get_love_emoji(self, love_type: str) -> str:
-        """Retourne l'emoji correspondant au type d'amour"""
-        love_emojis = {
-            "romantique": "💕",
-            "familial": "👨‍👩‍👧‍👦", 
-            "amical": "🤝",
-            "spirituel": "🙏",
-            "erotique": "🔥",
-            "narcissique": "🪞",
-            "platonique": "📚",
-            "compassionnel": "🤗"
-        }
-        return love_emojis.get(love_type, "💖")
-
     def generate_phrase_montage(self, phrases: List[PhraseMatch], 
                               output_file: str,
                               gap_duration: float = 1.5,
@@ -318,45 +417,38 @@ class PhraseSelector:
         """
         print(f"🎬 Génération montage de {len(phrases)} phrases...")
         
-        # Créer le montage
-        final_audio = None
-        gap_silence = AudioSegment.silent(duration=int(gap_duration * 1000))  # ms
+        # Créer le montage : les données PCM sont collectées puis assemblées en une seule fois
+        raw_chunks: List[bytes] = []
+        gap_silence = AudioSegment.silent(duration=int(gap_duration * 1000),  # ms
+                                          frame_rate=SLICE_FRAME_RATE)
+        
+        # Décoder tous les extraits en parallèle (un processus ffmpeg par extrait)
+        windows = [self._phrase_window(phrase) for phrase in phrases]
+        phrase_slices = self._load_audio_slices(windows)
         
-        for i, phrase in enumerate(phrases, 1):
+        for i, (phrase, phrase_audio) in enumerate(zip(phrases, phrase_slices), 1):
             print(f"  📝 {i}/{len(phrases)}: {phrase.text[:60]}...")
             
-            # Charger l'audio source
-            source_audio = self._load_audio(phrase.audio_path)
-            
-            # Extraire la phrase (en millisecondes)
-            start_ms = int(phrase.start * 1000)
-            end_ms = int(phrase.end * 1000)
-            
-            # Ajouter un peu de contexte (padding)
-            padding_ms = 100  # 0.1s de contexte
-            start_ms = max(0, start_ms - padding_ms)
-            end_ms = min(len(source_audio), end_ms + padding_ms)
-            
-            phrase_audio = source_audio[start_ms:end_ms]
-            
             # Normaliser l'audio pour équilibrer les volumes
             if normalize and normalize != "none":
                 phrase_audio = self.normalize_audio(phrase_audio, normalize)
             
             # Appliquer les fondus
-            if fade_in_duration > 0:
-                fade_in_ms = int(fade_in_duration * 1000)
-                phrase_audio = phrase_audio.fade_in(min(fade_in_ms, len(phrase_audio) // 4))
-            
-            if fade_out_duration > 0:
-                fade_out_ms = int(fade_out_duration * 1000)
-                phrase_audio = phrase_audio.fade_out(min(fade_out_ms, len(phrase_audio) // 4))
+            fade_in_ms = min(int(fade_in_duration * 1000), len(phrase_audio) // 4) if fade_in_duration > 0 else 0
+            fade_out_ms = min(int(fade_out_duration * 1000), len(phrase_audio) // 4) if fade_out_duration > 0 else 0
+            phrase_audio = self._apply_fades(phrase_audio, fade_in_ms, fade_out_ms)
             
             # Ajouter au montage final
-            if final_audio is None:
-                final_audio = phrase_audio
-            else:
-                final_audio = final_audio + gap_silence + phrase_audio
+            if raw_chunks:
+                raw_chunks.append(gap_silence.raw_data)
+            raw_chunks.append(phrase_audio.raw_data)
+        
+        final_audio = AudioSegment(
+            data=b"".join(raw_chunks),
+            sample_width=SLICE_SAMPLE_WIDTH,
+            frame_rate=SLICE_FRAME_RATE,
+            channels=SLICE_CHANNELS
+        )
         
         # Créer le dossier de sortie s'il n'existe pas
         output_path = Path("output_mix_play")
@@ -366,7 +458,7 @@ class PhraseSelector:
         output_file_path = output_path / output_file
         
         # Exporter en MP3
-        final_audio.export(str(output_file_path), format="mp3", bitrate="192k")
+        _export_mp3(final_audio, str(output_file_path), bitrate="192k")
         
         # Ajouter les métadonnées détaillées
         self._add_mp3_metadata(str(output_file_path), phrases, keywords or [], 
@@ -384,13 +476,98 @@ class PhraseSelector:
         
         return str(output_file_path)
     
-    def _load_audio(self, audio_path: str) -> AudioSegment:
-        """Charge un fichier audio avec cache"""
-        if audio_path not in self.audio_cache:
-            print(f"🎵 Chargement {Path(audio_path).name}...")
-            self.audio_cache[audio_path] = AudioSegment.from_file(audio_path)
+    def _phrase_window(self, phrase: PhraseMatch, padding_ms: int = 100) -> Tuple[str, int, int]:
+        """Calcule la fenêtre (fichier, début ms, fin ms) d'une phrase avec un peu de contexte"""
+        start_ms = max(0, int(phrase.start * 1000) - padding_ms)
+        end_ms = int(phrase.end * 1000) + padding_ms  # ffmpeg s'arrête de lui-même en fin de fichier
+        return (phrase.audio_path, start_ms, end_ms)
+    
+    def _load_audio_slices(self, windows: List[Tuple[str, int, int]]) -> List[AudioSegment]:
+        """Charge plusieurs extraits audio, en décodant en parallèle ceux absents du cache"""
+        missing = list(dict.fromkeys(w for w in windows if w not in self.audio_cache))
+        
+        decoded: Dict[Tuple[str, int, int], AudioSegment] = {}
+        if missing:
+            # ffmpeg tourne dans ses propres processus : des threads suffisent
+            with ThreadPoolExecutor() as executor:
+                pcm_chunks = list(executor.map(lambda w: _decode_slice(*w), missing))
+            
+            for window, pcm in zip(missing, pcm_chunks):
+                decoded[window] = AudioSegment(
+                    data=pcm,
+                    sample_width=SLICE_SAMPLE_WIDTH,
+                    frame_rate=SLICE_FRAME_RATE,
+                    channels=SLICE_CHANNELS
+                )
+        
+        slices = []
+        for window in windows:
+            if window in decoded:
+                segment = decoded[window]
+                self._cache_audio_slice(window, segment)
+            else:
+                segment = self._load_audio_slice(*window)
+            slices.append(segment)
+        
+        return slices
+    
+    def _load_audio_slice(self, audio_path: str, start_ms: int, end_ms: int) -> AudioSegment:
+        """Charge un extrait audio avec cache LRU borné (sans décoder le fichier entier)"""
+        key = (audio_path, start_ms, end_ms)
+        if key in self.audio_cache:
+            self.audio_cache.move_to_end(key)
+            return self.audio_cache[key]
+        
+        segment = AudioSegment(
+            data=_decode_slice(audio_path, start_ms, end_ms),
+            sample_width=SLICE_SAMPLE_WIDTH,
+            frame_rate=SLICE_FRAME_RATE,
+            channels=SLICE_CHANNELS
+        )
+        self._cache_audio_slice(key, segment)
+        
+        return segment
+    
+    def _cache_audio_slice(self, key: Tuple[str, int, int], segment: AudioSegment):
+        """Ajoute un extrait au cache LRU en évinçant le plus ancien si nécessaire"""
+        self.audio_cache[key] = segment
+        self.audio_cache.move_to_end(key)
+        if len(self.audio_cache) > AUDIO_CACHE_SIZE:
+            self.audio_cache.popitem(last=False)
+    
+    def _apply_fades(self, audio: AudioSegment, fade_in_ms: int, fade_out_ms: int) -> AudioSegment:
+        """Applique les fondus d'entrée/sortie par multiplication NumPy des échantillons bruts"""
+        if fade_in_ms <= 0 and fade_out_ms <= 0:
+            return audio
+        
+        if audio.sample_width not in (1, 2, 4):
+            # Largeur d'échantillon non gérée par NumPy : fondus pydub
+            if fade_in_ms > 0:
+                audio = audio.fade_in(fade_in_ms)
+            if fade_out_ms > 0:
+                audio = audio.fade_out(fade_out_ms)
+            return audio
+        
+        dtype = np.dtype(f"<i{audio.sample_width}")
+        frames = np.frombuffer(audio.raw_data, dtype=dtype).reshape(-1, audio.channels).copy()
+        
+        fade_in_frames = min(int(audio.frame_rate * fade_in_ms / 1000), len(frames))
+        fade_out_frames = min(int(audio.frame_rate * fade_out_ms / 1000), len(frames))
         
-        return self.audio_cache[audio_path]
+        if fade_in_frames > 0:
+            ramp = _fade_ramp(fade_in_frames)[:, None]
+            frames[:fade_in_frames] = (frames[:fade_in_frames] * ramp).astype(dtype)
+        
+        if fade_out_frames > 0:
+            ramp = _fade_ramp(fade_out_frames)[::-1, None]
+            frames[-fade_out_frames:] = (frames[-fade_out_frames:] * ramp).astype(dtype)
+        
+        return AudioSegment(
+            data=frames.tobytes(),
+            sample_width=audio.sample_width,
+            frame_rate=audio.frame_rate,
+            channels=audio.channels
+        )
     
     def normalize_audio(self, audio: AudioSegment, method: str = "peak") -> AudioSegment:
         """Normalise l'audio selon différentes méthodes
@@ -406,8 +583,19 @@ class PhraseSelector:
         elif method == "rms":
             # Normalisation par RMS (Root Mean Square) - plus équilibré
             target_dBFS = -20.0  # Volume cible
-            change_in_dBFS = target_dBFS - audio.dBFS
-            return audio.apply_gain(change_in_dBFS)
+            if audio.sample_width not in (1, 2, 4):
+                change_in_dBFS = target_dBFS - audio.dBFS
+                return audio.apply_gain(change_in_dBFS)
+            
+            # RMS calculé en une seule réduction NumPy sur les échantillons bruts
+            samples = np.frombuffer(audio.raw_data, dtype=f"<i{audio.sample_width}")
+            if samples.size == 0:
+                return audio
+            rms = np.sqrt(np.mean(np.square(samples, dtype=np.float64)))
+            if rms == 0:
+                return audio  # Silence : aucun gain applicable
+            current_dBFS = 20 * math.log10(rms / audio.max_possible_amplitude)
+            return audio.apply_gain(target_dBFS - current_dBFS)
         
         elif method == "loudness":
             # Normalisation par loudness perçue (EBU R128-like)
@@ -453,50 +641,38 @@ class PhraseSelector:
             fichiers = list(set(Path(p.file_name).stem for p in phrases))
             love_types = list(set(getattr(p, 'love_type', None) for p in phrases if hasattr(p, 'love_type') and p.love_type))
             
-            # Métadonnées globales structurées
-            audio_file.tags.add(COMM(encoding=3, lang='fra', desc='amour_search', text=', '.join(keywords)))
-            audio_file.tags.add(COMM(encoding=3, lang='fra', desc='amour_filter_type', text=love_type or 'none'))
-            audio_file.tags.add(COMM(encoding=3, lang='fra', desc='amour_detected_types', text=', '.join(love_types)))
-            audio_file.tags.add(COMM(encoding=3, lang='fra', desc='amour_duration', text=f"{duration:.1f}s"))
-            audio_file.tags.add(COMM(encoding=3, lang='fra', desc='amour_speakers', text=', '.join(intervenants)))
-            audio_file.tags.add(COMM(encoding=3, lang='fra', desc='amour_sources', text=', '.join(fichiers)))
-            audio_file.tags.add(COMM(encoding=3, lang='fra', desc='amour_count', text=str(len(phrases))))
+            # Toutes les métadonnées structurées sont regroupées puis posées en une fois
+            comm_kw = {"encoding": 3, "lang": "fra"}
+            comments = [
+                COMM(**comm_kw, desc='amour_search', text=', '.join(keywords)),
+                COMM(**comm_kw, desc='amour_filter_type', text=love_type or 'none'),
+                COMM(**comm_kw, desc='amour_detected_types', text=', '.join(love_types)),
+                COMM(**comm_kw, desc='amour_duration', text=f"{duration:.1f}s"),
+                COMM(**comm_kw, desc='amour_speakers', text=', '.join(intervenants)),
+                COMM(**comm_kw, desc='amour_sources', text=', '.join(fichiers)),
+                COMM(**comm_kw, desc='amour_count', text=str(len(phrases))),
+            ]
             
-            # Métadonnées détaillées pour chaque phrase
-            for i, phrase in enumerate(phrases, 1):
-                prefix = f"amour_phrase{i}"
-                
-                # Texte de la phrase
-                audio_file.tags.add(COMM(encoding=3, lang='fra', desc=f'{prefix}_text', 
-                                       text=phrase.text))
-                
-                # Mots-clés trouvés
-                audio_file.tags.add(COMM(encoding=3, lang='fra', desc=f'{prefix}_keywords', 
-                                       text=', '.join(phrase.keywords_found)))
-                
-                # Source et intervenant
-                audio_file.tags.add(COMM(encoding=3, lang='fra', desc=f'{prefix}_source', 
-                                       text=Path(phrase.file_name).stem))
-                audio_file.tags.add(COMM(encoding=3, lang='fra', desc=f'{prefix}_speaker', 
-                                       text=phrase.speaker))
-                
-                # Type d'amour détecté
-                phrase_love_type = getattr(phrase, 'love_type', None)
-                if phrase_love_type:
-                    audio_file.tags.add(COMM(encoding=3, lang='fra', desc=f'{prefix}_love_type', 
-                                           text=phrase_love_type))
-                
-                # Score et timecodes
-                audio_file.tags.add(COMM(encoding=3, lang='fra', desc=f'{prefix}_score', 
-                                       text=f"{phrase.match_score:.1f}"))
-                audio_file.tags.add(COMM(encoding=3, lang='fra', desc=f'{prefix}_start', 
-                                       text=f"{phrase.start:.1f}s"))
-                audio_file.tags.add(COMM(encoding=3, lang='fra', desc=f'{prefix}_end', 
-                                       text=f"{phrase.end:.1f}s"))
-                audio_file.tags.add(COMM(encoding=3, lang='fra', desc=f'{prefix}_duration', 
-                                       text=f"{phrase.end-phrase.start:.1f}s"))
-                audio_file.tags.add(COMM(encoding=3, lang='fra', desc=f'{prefix}_segment_id', 
-                                       text=str(phrase.segment_id)))
+            # Métadonnées détaillées des phrases : un seul bloc JSON compact
+            phrases_payload = [
+                {
+                    "t": phrase.text,
+                    "k": phrase.keywords_found,
+                    "s": phrase.speaker,
+                    "src": Path(phrase.file_name).stem,
+                    "score": round(phrase.match_score, 1),
+                    "start": round(phrase.start, 1),
+                    "end": round(phrase.end, 1),
+                    "seg": phrase.segment_id,
+                    "love": getattr(phrase, 'love_type', None),
+                }
+                for phrase in phrases
+            ]
+            comments.append(COMM(**comm_kw, desc='amour_phrases_json',
+                                 text=json.dumps(phrases_payload, ensure_ascii=False,
+                                                 separators=(',', ':'))))
+            
+            audio_file.tags.setall('COMM', comments)
             
             audio_file.save()
             print(f"📋 Métadonnées structurées ajoutées au MP3 ({len(phrases)} phrases, type: {love_type or 'tous'})")
@@ -510,6 +686,7 @@ def main():
     # Initialiser seed aléatoire basé sur l'horodatage pour garantir la variation
     seed = int(time.time() * 1000000) % 2147483647  # Utiliser les microsecondes
     random.seed(seed)
+    np.random.seed(seed)
     print(f"🎲 Seed aléatoire: {seed}")
     
     if len(sys.argv) < 3:
@@ -554,11 +731,16 @@ def main():
     selector.load_phrases()
     
     # Rechercher les phrases avec plus de variation
-    matches = selector.search_phrases(
-        keywords, 
-        min_score=0.3,
-        love_types=love_types
-    )
+    try:
+        matches = selector.search_phrases(
+            keywords, 
+            min_score=0.3,
+            love_types=love_types
+        )
+    except ValueError as e:
+        print(f"❌ {e}")
+        print(f"Types d'amour disponibles: {', '.join(sorted(AVAILABLE_LOVE_TYPES))}")
+        sys.exit(1)
     
     if not matches:
         print("❌ Aucune phrase trouvée avec ces critères")
@@ -7,17 +7,99 @@ Reconstruit les phrases à partir des mots individuels dans les JSONs
 
 import sys
 from pathlib import Path
-import json
 import re
 from datetime import datetime
-from typing import List, Dict, Optional
-from dataclasses import dataclass
-from pydub import AudioSegment
+from functools import reduce, lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass, field
+import numpy as np
 import difflib
+import subprocess
+import unicodedata
+
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
 # Ajouter le répertoire src au path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
+from script_utils import load_json
+
+# Nombre maximum d'extraits audio décodés gardés en mémoire
+AUDIO_CACHE_SIZE = 32
+
+# Format PCM des extraits décodés par ffmpeg
+SLICE_FRAME_RATE = 44100
+SLICE_CHANNELS = 1
+
+# Caractères de ponctuation testés sur chaque mot lors du découpage
+_END_PUNCT_CHARS = frozenset('.!?…')  # Ponctuation forte (fin de phrase)
+_MID_PUNCT_CHARS = frozenset(',;:')   # Ponctuation faible
+
+# Expressions régulières du nettoyage de texte, compilées une seule fois
+_CLEAN_PUNCT_RE = re.compile(r'[.,;:!?"\'\-\(\)\[\]{}]')
+_MULTISPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=16)
+def _fade_ramp(length: int) -> np.ndarray:
+    """Rampe linéaire 0 -> 1 de `length` trames, partagée entre les phrases"""
+    ramp = np.linspace(0.0, 1.0, length, dtype=np.float32)[:, None]
+    ramp.setflags(write=False)
+    return ramp
+
+
+def _trigrams(token: str) -> set:
+    """Trigrammes de caractères d'un mot, bordé d'espaces pour couvrir les mots courts"""
+    padded = f" {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _decode_slice(audio_path: str, start_ms: int, end_ms: int) -> np.ndarray:
+    """Décode uniquement la fenêtre [start_ms, end_ms] d'un fichier audio via ffmpeg
+    
+    Returns:
+        Échantillons int16 (trames x SLICE_CHANNELS) à SLICE_FRAME_RATE Hz
+    """
+    cmd = [
+        "ffmpeg", "-v", "error",
+        "-ss", f"{start_ms / 1000:.3f}",
+        "-t", f"{(end_ms - start_ms) / 1000:.3f}",
+        "-i", str(audio_path),
+        "-f", "s16le",
+        "-ac", str(SLICE_CHANNELS),
+        "-ar", str(SLICE_FRAME_RATE),
+        "pipe:1",
+    ]
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+    return np.frombuffer(result.stdout, dtype="<i2").reshape(-1, SLICE_CHANNELS)
+
+
+def _export_mp3(samples: np.ndarray, frame_rate: int, output_path: str, bitrate: str = "192k"):
+    """
+    Encode un tableau PCM (trames x canaux) en MP3 en l'envoyant directement à ffmpeg,
+    sans passer par le WAV temporaire de `AudioSegment.export`
+    """
+    cmd = [
+        "ffmpeg", "-y", "-v", "error",
+        "-f", f"s{samples.dtype.itemsize * 8}le",
+        "-ar", str(frame_rate),
+        "-ac", str(samples.shape[1]),
+        "-i", "pipe:0",
+        "-c:a", "libmp3lame",
+        "-b:a", bitrate,
+        "-threads", "0",
+        str(output_path),
+    ]
+    subprocess.run(cmd, input=samples.tobytes(), stdout=subprocess.DEVNULL,
+                   stderr=subprocess.PIPE, check=True)
+
+
 @dataclass
 class Word:
     """Représente un mot avec ses timecodes"""
@@ -39,6 +121,9 @@ class ReconstructedSentence:
     duration: float
     keywords_found: List[str]
     match_score: float
+    clean_text: str = ""  # Texte nettoyé pour la recherche (calculé au chargement)
+    clean_tokens: frozenset = field(default_factory=frozenset)
+    file_stem: str = ""  # Nom du fichier source sans extension
 
 class SentenceReconstructor:
     """Reconstruit et monte des phrases grammaticales réelles"""
@@ -47,7 +132,11 @@ class SentenceReconstructor:
         self.transcription_dir = Path(transcription_dir)
         self.audio_dir = Path(audio_dir)
         self.sentences: List[ReconstructedSentence] = []
-        self.audio_cache: Dict[str, AudioSegment] = {}
+        self.token_index: Dict[str, np.ndarray] = {}  # mot nettoyé -> indices triés des phrases
+        self.vocabulary: List[str] = []
+        self.trigram_index: Dict[str, List[int]] = {}  # trigramme -> indices dans self.vocabulary
+        self.durations = np.empty(0, dtype=np.float64)  # Durées des phrases (même ordre que self.sentences)
+        self.audio_cache: "OrderedDict[Tuple[str, int, int], np.ndarray]" = OrderedDict()  # Cache LRU d'extraits
         
     def load_sentences(self):
         """Charge et reconstruit toutes les phrases grammaticales"""
@@ -55,18 +144,49 @@ class SentenceReconstructor:
         
         json_files = list(self.transcription_dir.glob("*.json"))
         
-        for json_file in json_files:
-            self._reconstruct_sentences_from_file(json_file)
+        if len(json_files) > 1:
+            # Chaque fichier est indépendant : analyse répartie sur plusieurs processus
+            audio_dirs = [str(self.audio_dir)] * len(json_files)
+            with ProcessPoolExecutor() as executor:
+                for file_sentences in executor.map(_reconstruct_file, json_files, audio_dirs):
+                    self.sentences.extend(file_sentences)
+        else:
+            for json_file in json_files:
+                self.sentences.extend(self._reconstruct_sentences_from_file(json_file))
+        
+        self._build_search_index()
         
         print(f"✅ {len(self.sentences)} phrases reconstruites depuis {len(json_files)} fichiers")
         
-    def _reconstruct_sentences_from_file(self, json_path: Path):
-        """Reconstruit les phrases d'un fichier de transcription"""
+    def _build_search_index(self):
+        """Construit l'index inversé mot nettoyé -> phrases et le tableau des durées"""
+        postings: Dict[str, List[int]] = {}
+        
+        for sentence_id, sentence in enumerate(self.sentences):
+            for token in sentence.clean_tokens:
+                postings.setdefault(token, []).append(sentence_id)
+        
+        # Listes de postings figées en tableaux int32 (déjà triés par construction)
+        self.token_index = {token: np.asarray(ids, dtype=np.int32) for token, ids in postings.items()}
+        self.vocabulary = list(self.token_index)
+        
+        # Index trigrammes -> mots du vocabulaire, pour ne comparer en flou que des mots proches
+        self.trigram_index = {}
+        for token_id, token in enumerate(self.vocabulary):
+            for trigram in _trigrams(token):
+                self.trigram_index.setdefault(trigram, []).append(token_id)
+        self.durations = np.fromiter((s.duration for s in self.sentences),
+                                     dtype=np.float64, count=len(self.sentences))
+    
+    def _reconstruct_sentences_from_file(self, json_path: Path) -> List[ReconstructedSentence]:
+        """Reconstruit les phrases d'un fichier de transcription (sans modifier l'état)"""
+        file_sentences = []
+        
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json(json_path)
             
             file_name = data['metadata']['file']
+            file_stem = Path(file_name).stem
             audio_path = self.audio_dir / file_name
             
             for segment in data['transcription']['segments']:
@@ -95,6 +215,7 @@ class SentenceReconstructor:
                     
                     # Construire le texte de la phrase
                     text = " ".join(w.word.strip() for w in sentence_words)
+                    clean_text = self._clean_word(text)
                     
                     # Calculer les timecodes
                     start_time = sentence_words[0].start
@@ -115,52 +236,54 @@ class SentenceReconstructor:
                         end=end_time,
                         duration=duration,
                         keywords_found=[],
-                        match_score=0.0
+                        match_score=0.0,
+                        clean_text=clean_text,
+                        clean_tokens=frozenset(clean_text.split()),
+                        file_stem=file_stem
                     )
                     
-                    self.sentences.append(sentence)
+                    file_sentences.append(sentence)
                 
         except Exception as e:
             print(f"⚠️ Erreur reconstruction {json_path}: {e}")
+        
+        return file_sentences
     
     def _split_into_sentences(self, words: List[Word]) -> List[List[Word]]:
         """
         Découpe une liste de mots en phrases grammaticales
         Basé sur la ponctuation et les pauses
         """
-        sentences = []
-        current_sentence = []
+        # Fin de phrase si :
+        # 1. Ponctuation forte (. ! ? ...)
+        # 2. Pause longue après le mot (>1 seconde)
+        # 3. Phrase déjà assez longue (>15 mots) + virgule ou pause
+        n = len(words)
+        if n == 0:
+            return []
+        
+        # Pauses entre mots consécutifs calculées en une passe vectorisée
+        starts = np.fromiter((w.start for w in words), dtype=np.float64, count=n)
+        ends = np.fromiter((w.end for w in words), dtype=np.float64, count=n)
+        hard_breaks = np.zeros(n, dtype=bool)
+        hard_breaks[:-1] = (starts[1:] - ends[:-1]) > 1.0  # Pause > 1 seconde
+        hard_breaks |= np.fromiter((not _END_PUNCT_CHARS.isdisjoint(w.word) for w in words),
+                                   dtype=bool, count=n)
+        hard_breaks[-1] = True  # Le dernier mot termine toujours la phrase
         
-        for i, word in enumerate(words):
-            current_sentence.append(word)
-            
-            # Fin de phrase si :
-            # 1. Ponctuation forte (. ! ? ...)
-            # 2. Pause longue après le mot (>1 seconde)
-            # 3. Phrase déjà assez longue (>15 mots) + virgule ou pause
-            
-            is_end_punctuation = re.search(r'[.!?…]', word.word)
-            
-            next_word_pause = False
-            if i < len(words) - 1:
-                next_word = words[i + 1]
-                pause_duration = next_word.start - word.end
-                next_word_pause = pause_duration > 1.0  # Pause > 1 seconde
-            
-            long_sentence_break = (
-                len(current_sentence) > 15 and 
-                (re.search(r'[,;:]', word.word) or next_word_pause)
-            )
+        sentences = []
+        sentence_start = 0
+        
+        for cut in np.flatnonzero(hard_breaks).tolist():
+            # Coupures sur ponctuation faible une fois la phrase assez longue
+            for i in range(sentence_start + 15, cut):
+                if i - sentence_start + 1 > 15 and not _MID_PUNCT_CHARS.isdisjoint(words[i].word):
+                    sentences.append(words[sentence_start:i + 1])
+                    sentence_start = i + 1
             
-            # Fin de phrase détectée
-            if is_end_punctuation or next_word_pause or long_sentence_break or i == len(words) - 1:
-                if len(current_sentence) >= 3:  # Au moins 3 mots
-                    sentences.append(current_sentence.copy())
-                current_sentence = []
-        
-        # Ajouter la dernière phrase si elle existe
-        if current_sentence and len(current_sentence) >= 3:
-            sentences.append(current_sentence)
+            if cut - sentence_start + 1 >= 3:  # Au moins 3 mots
+                sentences.append(words[sentence_start:cut + 1])
+            sentence_start = cut + 1
         
         return sentences
     
@@ -175,62 +298,75 @@ class SentenceReconstructor:
         # Nettoyer les mots-clés
         clean_keywords = [self._clean_word(kw) for kw in keywords if kw.strip()]
         
-        matches = []
+        # Correspondances floues calculées une seule fois sur tout le vocabulaire
+        fuzzy_hits = self._fuzzy_token_matches(clean_keywords)
+        
+        # Phrases candidates : union des postings exacts et des phrases approchées
+        empty = np.empty(0, dtype=np.int32)
+        exact_postings = [self.token_index.get(keyword, empty) for keyword in clean_keywords]
+        fuzzy_postings = [np.fromiter(hits, dtype=np.int32, count=len(hits)) for hits in fuzzy_hits]
+        candidates = reduce(np.union1d, exact_postings + fuzzy_postings, empty)
+        
+        # Filtrer par durée (vectorisé)
+        durations = self.durations[candidates]
+        keep = durations <= max_duration
+        candidates, durations = candidates[keep], durations[keep]
+        
+        # Correspondances exactes / floues par mot-clé : matrices (mots-clés x candidats)
+        exact = np.zeros((len(clean_keywords), candidates.size), dtype=bool)
+        fuzzy = np.zeros_like(exact)
+        for k in range(len(clean_keywords)):
+            exact[k] = np.isin(candidates, exact_postings[k], assume_unique=True)
+            fuzzy[k] = np.isin(candidates, fuzzy_postings[k], assume_unique=True)  # disjoint des exacts
+        
+        found_count = (exact | fuzzy).sum(axis=0)
+        total_score = 2.0 * exact.sum(axis=0) + 1.0 * fuzzy.sum(axis=0)
+        
+        # Score avec bonus pour phrases courtes
+        short_bonus = np.where(durations <= 5.0, 1.5, np.where(durations <= 8.0, 1.3, 1.0))
+        scores = (found_count / max(len(clean_keywords), 1)) * total_score * short_bonus
+        
+        # Ne garder que les meilleurs candidats (sélection partielle en O(N) au lieu d'un tri complet) ;
+        # la diversification des sources dispose d'un vivier deux fois plus large
+        limit = max_results * 2 if diversify_sources else max_results
+        if limit <= 0:
+            return []
+        valid = np.flatnonzero(found_count > 0)
+        if valid.size > limit:
+            valid = valid[np.argpartition(-scores[valid], limit - 1)[:limit]]
+        
+        # Trier par score décroissant (ordre du corpus à score égal)
+        order = valid[np.lexsort((valid, -scores[valid]))]
         
-        for sentence in self.sentences:
-            # Filtrer par durée
-            if sentence.duration > max_duration:
-                continue
-                
-            # Nettoyer le texte de la phrase
-            clean_text = self._clean_word(sentence.text)
-            clean_words = clean_text.split()
+        matches = []
+        for i in order:
+            sentence_id = int(candidates[i])
+            sentence = self.sentences[sentence_id]
             
-            # Chercher les correspondances
             found_keywords = []
-            total_score = 0
-            
-            for keyword in clean_keywords:
-                # Recherche exacte d'abord
-                if keyword in clean_words:
+            for k, keyword in enumerate(clean_keywords):
+                if exact[k, i]:
                     found_keywords.append(keyword)
-                    total_score += 2.0
-                else:
-                    # Recherche floue
-                    similar = difflib.get_close_matches(
-                        keyword, clean_words, n=1, cutoff=0.8
-                    )
-                    if similar:
-                        found_keywords.append(f"{keyword}≈{similar[0]}")
-                        total_score += 1.0
+                elif fuzzy[k, i]:
+                    found_keywords.append(f"{keyword}≈{fuzzy_hits[k][sentence_id]}")
             
-            # Si au moins un mot-clé trouvé
-            if found_keywords:
-                # Score avec bonus pour phrases courtes
-                match_score = (len(found_keywords) / len(clean_keywords)) * total_score
-                
-                if sentence.duration <= 8.0:
-                    match_score *= 1.3
-                elif sentence.duration <= 5.0:
-                    match_score *= 1.5
-                
-                sentence_copy = ReconstructedSentence(
-                    text=sentence.text,
-                    words=sentence.words,
-                    file_name=sentence.file_name,
-                    audio_path=sentence.audio_path,
-                    speaker=sentence.speaker,
-                    start=sentence.start,
-                    end=sentence.end,
-                    duration=sentence.duration,
-                    keywords_found=found_keywords,
-                    match_score=match_score
-                )
-                
-                matches.append(sentence_copy)
-        
-        # Trier par score décroissant
-        matches.sort(key=lambda x: x.match_score, reverse=True)
+            sentence_copy = ReconstructedSentence(
+                text=sentence.text,
+                words=sentence.words,
+                file_name=sentence.file_name,
+                audio_path=sentence.audio_path,
+                speaker=sentence.speaker,
+                start=sentence.start,
+                end=sentence.end,
+                duration=sentence.duration,
+                keywords_found=found_keywords,
+                match_score=float(scores[i]),
+                clean_text=sentence.clean_text,
+                clean_tokens=sentence.clean_tokens,
+                file_stem=sentence.file_stem
+            )
+            
+            matches.append(sentence_copy)
         
         # Diversifier les sources si demandé
         if diversify_sources and len(matches) > max_results:
@@ -240,17 +376,30 @@ class SentenceReconstructor:
         
         return matches
     
+    def _trigram_candidates(self, keyword: str) -> List[str]:
+        """Mots du vocabulaire partageant au moins un trigramme avec le mot-clé"""
+        if len(keyword) <= 3:
+            # Mots très courts : trop peu de trigrammes pour filtrer sans perte
+            return self.vocabulary
+        
+        token_ids = set()
+        for trigram in _trigrams(keyword):
+            token_ids.update(self.trigram_index.get(trigram, ()))
+        return [self.vocabulary[t] for t in sorted(token_ids)]
+    
     def _diversify_sources(self, matches: List[ReconstructedSentence], max_results: int) -> List[ReconstructedSentence]:
         """Diversifie les sources dans la sélection finale"""
         selected = []
+        selected_ids = set()
         used_sources = set()
         
         # Première passe : prendre les meilleurs de chaque source
         for match in matches:
-            source_key = f"{Path(match.file_name).stem}_{match.speaker}"
+            source_key = (match.file_stem, match.speaker)
             
             if source_key not in used_sources:
                 selected.append(match)
+                selected_ids.add(id(match))
                 used_sources.add(source_key)
                 
                 if len(selected) >= max_results:
@@ -259,26 +408,70 @@ class SentenceReconstructor:
         # Deuxième passe : compléter si besoin
         if len(selected) < max_results:
             for match in matches:
-                if match not in selected:
+                if id(match) not in selected_ids:
                     selected.append(match)
                     if len(selected) >= max_results:
                         break
         
         return selected
     
+    def _fuzzy_token_matches(self, keywords: List[str], cutoff: float = 0.8) -> List[Dict[int, str]]:
+        """
+        Associe, pour chaque mot-clé, chaque phrase à son mot le plus proche
+        (similarité >= cutoff) à partir des mots du vocabulaire
+        """
+        if not keywords or not self.vocabulary:
+            return [{} for _ in keywords]
+        
+        similar_per_keyword = []
+        for keyword in keywords:
+            # Seuls les mots partageant au moins un trigramme avec le mot-clé sont comparés
+            candidates = self._trigram_candidates(keyword)
+            if not candidates:
+                similar_per_keyword.append([])
+            elif RAPIDFUZZ_AVAILABLE:
+                # Scores calculés en C++ sur tous les cœurs ;
+                # fuzz.ratio est l'équivalent de SequenceMatcher.ratio (échelle 0-100)
+                scores = fuzz_process.cdist([keyword], candidates, scorer=fuzz.ratio,
+                                            score_cutoff=cutoff * 100, dtype=np.uint8, workers=-1)[0]
+                token_ids = np.flatnonzero(scores)
+                token_ids = token_ids[np.argsort(-scores[token_ids], kind="stable")]
+                similar_per_keyword.append([candidates[t] for t in token_ids])
+            else:
+                similar_per_keyword.append(
+                    difflib.get_close_matches(keyword, candidates, n=len(candidates), cutoff=cutoff)
+                )
+        
+        fuzzy_hits = []
+        for keyword, similar_tokens in zip(keywords, similar_per_keyword):
+            # Les phrases contenant déjà le mot exact n'ont pas besoin du repli approché
+            exact_ids = self.token_index.get(keyword)
+            
+            # Les mots sont triés par similarité décroissante : le premier gagne
+            hits: Dict[int, str] = {}
+            for token in similar_tokens:
+                if token == keyword:
+                    continue
+                sentence_ids = self.token_index[token]
+                if exact_ids is not None:
+                    sentence_ids = sentence_ids[~np.isin(sentence_ids, exact_ids, assume_unique=True)]
+                for sentence_id in sentence_ids.tolist():
+                    hits.setdefault(sentence_id, token)
+            fuzzy_hits.append(hits)
+        
+        return fuzzy_hits
+    
     def _clean_word(self, text: str) -> str:
         """Nettoie le texte pour la recherche"""
-        import unicodedata
-        
         # Minuscules et suppression ponctuation
-        text = re.sub(r'[.,;:!?"\'\-\(\)\[\]{}]', ' ', text.lower())
+        text = _CLEAN_PUNCT_RE.sub(' ', text.lower())
         
         # Normaliser accents
         text = unicodedata.normalize('NFD', text)
         text = ''.join(c for c in text if not unicodedata.combining(c))
         
         # Espaces multiples → simple
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _MULTISPACE_RE.sub(' ', text).strip()
         
         return text
     
@@ -294,45 +487,50 @@ class SentenceReconstructor:
         
         print(f"🎬 Génération montage de {len(sentences)} phrases grammaticales...")
         
-        # Créer le montage
-        final_audio = None
-        gap_silence = AudioSegment.silent(duration=int(gap_duration * 1000))
+        # Créer le montage : extraits PCM collectés puis concaténés en une seule allocation
+        chunks: List[np.ndarray] = []
+        frame_rate = SLICE_FRAME_RATE
+        gap_silence = np.zeros((int(gap_duration * frame_rate), SLICE_CHANNELS), dtype=np.int16)
         
         for i, sentence in enumerate(sentences, 1):
             print(f"  📝 {i}/{len(sentences)}: {sentence.text}")
             print(f"      ⏱️ {sentence.duration:.1f}s - {len(sentence.words)} mots")
             
-            # Charger l'audio source
-            source_audio = self._load_audio(sentence.audio_path)
-            
-            # Extraire la phrase avec un petit padding
+            # Extraire la phrase avec un petit padding (seule cette fenêtre est décodée)
             start_ms = max(0, int((sentence.start - 0.1) * 1000))
-            end_ms = min(len(source_audio), int((sentence.end + 0.1) * 1000))
+            end_ms = int((sentence.end + 0.1) * 1000)
             
-            sentence_audio = source_audio[start_ms:end_ms]
+            samples = self._load_audio_slice(sentence.audio_path, start_ms, end_ms).copy()
+            sentence_ms = len(samples) * 1000 // frame_rate
             
-            # Appliquer les fondus
+            if chunks:
+                chunks.append(gap_silence)
+            
+            # Appliquer les fondus (rampes linéaires sur les échantillons bruts)
             if fade_in_duration > 0:
-                fade_in_ms = int(fade_in_duration * 1000)
-                sentence_audio = sentence_audio.fade_in(min(fade_in_ms, len(sentence_audio) // 4))
+                fade_in_ms = min(int(fade_in_duration * 1000), sentence_ms // 4)
+                fade_in_frames = min(int(frame_rate * fade_in_ms / 1000), len(samples))
+                if fade_in_frames > 0:
+                    samples[:fade_in_frames] = samples[:fade_in_frames] * _fade_ramp(fade_in_frames)
             
             if fade_out_duration > 0:
-                fade_out_ms = int(fade_out_duration * 1000)
-                sentence_audio = sentence_audio.fade_out(min(fade_out_ms, len(sentence_audio) // 4))
+                fade_out_ms = min(int(fade_out_duration * 1000), sentence_ms // 4)
+                fade_out_frames = min(int(frame_rate * fade_out_ms / 1000), len(samples))
+                if fade_out_frames > 0:
+                    samples[-fade_out_frames:] = samples[-fade_out_frames:] * _fade_ramp(fade_out_frames)[::-1]
             
             # Ajouter au montage
-            if final_audio is None:
-                final_audio = sentence_audio
-            else:
-                final_audio = final_audio + gap_silence + sentence_audio
+            chunks.append(samples)
+        
+        final_audio = np.concatenate(chunks, axis=0)
         
         # Sauvegarder
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        final_audio.export(str(output_path), format="mp3", bitrate="192k")
+        _export_mp3(final_audio, frame_rate, str(output_path), bitrate="192k")
         
-        duration = len(final_audio) / 1000.0
+        duration = len(final_audio) / frame_rate
         print(f"✅ Montage généré: {output_path.name}")
         print(f"⏱️ Durée totale: {duration:.1f}s")
         print(f"🎭 Intervenants: {', '.join(set(s.speaker for s in sentences))}")
@@ -340,13 +538,28 @@ class SentenceReconstructor:
         
         return str(output_path)
     
-    def _load_audio(self, audio_path: str) -> AudioSegment:
-        """Charge un fichier audio avec cache"""
-        if audio_path not in self.audio_cache:
-            print(f"🎵 Chargement {Path(audio_path).name}...")
-            self.audio_cache[audio_path] = AudioSegment.from_file(audio_path)
+    def _load_audio_slice(self, audio_path: str, start_ms: int, end_ms: int) -> np.ndarray:
+        """Charge un extrait audio avec cache LRU borné (sans décoder le fichier entier)"""
+        key = (audio_path, start_ms, end_ms)
+        if key in self.audio_cache:
+            self.audio_cache.move_to_end(key)
+            return self.audio_cache[key]
+        
+        # Préférer une version WAV déjà décodée à côté du fichier source
+        wav_path = Path(audio_path).with_suffix(".wav")
+        source_path = wav_path if wav_path.exists() else Path(audio_path)
         
-        return self.audio_cache[audio_path]
+        samples = _decode_slice(str(source_path), start_ms, end_ms)
+        
+        self.audio_cache[key] = samples
+        if len(self.audio_cache) > AUDIO_CACHE_SIZE:
+            self.audio_cache.popitem(last=False)
+        
+        return samples
+
+def _reconstruct_file(json_path: Path, audio_dir: str) -> List[ReconstructedSentence]:
+    """Reconstruit les phrases d'un fichier dans un processus de travail"""
+    return SentenceReconstructor(audio_dir=audio_dir)._reconstruct_sentences_from_file(json_path)
 
 def main():
     """Interface en ligne de commande"""
@@ -419,7 +632,6 @@ def main():
         import platform
         if platform.system() == "Darwin":
             try:
-                import subprocess
                 subprocess.run(["afplay", audio_file], check=True)
                 print("✅ Lecture terminée")
             except Exception as e:
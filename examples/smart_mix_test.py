@@ -9,12 +9,78 @@ from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Set
 
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Ajouter le répertoire src au path
 sys.path.append(str(Path(__file__).parent / "src"))
 
 from mix_player import MixPlayer, WordMatch, ComposedSentence
 
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _count_unique_ids(ids):
+        """Nombre de valeurs distinctes dans un petit tableau d'identifiants."""
+        sorted_ids = np.sort(ids)
+        count = 1
+        for i in range(1, sorted_ids.size):
+            if sorted_ids[i] != sorted_ids[i - 1]:
+                count += 1
+        return count
+
+    @njit(cache=True)
+    def _score_combinations_jit(confidence, speakers, files, starts, ends,
+                                combinations, max_time_gap, same_speaker_bonus):
+        """Boucle compilée équivalente à SmartMixPlayer._score_sequence sur chaque combinaison."""
+        n, count = combinations.shape
+        scores = np.empty(count)
+        picked_speakers = np.empty(n, dtype=np.int64)
+        picked_files = np.empty(n, dtype=np.int64)
+        
+        for c in range(count):
+            # Score de base : moyenne des confidences
+            total = 0.0
+            for p in range(n):
+                index = combinations[p, c]
+                total += confidence[p, index]
+                picked_speakers[p] = speakers[p, index]
+                picked_files[p] = files[p, index]
+            score = total / n
+            
+            # Bonus pour la cohérence du locuteur
+            unique_speakers = _count_unique_ids(picked_speakers)
+            if unique_speakers == 1:
+                score += same_speaker_bonus * 2
+            elif unique_speakers == 2:
+                score += same_speaker_bonus
+            
+            # Pénalité / bonus selon l'écart temporel entre mots consécutifs du même fichier
+            for p in range(n - 1):
+                if picked_files[p] == picked_files[p + 1]:
+                    time_gap = abs(starts[p + 1, combinations[p + 1, c]] - ends[p, combinations[p, c]])
+                    if time_gap > max_time_gap:
+                        score -= min(0.2, time_gap / max_time_gap * 0.1)
+                    else:
+                        score += max(0.0, (max_time_gap - time_gap) / max_time_gap * 0.05)
+            
+            # Bonus pour la variété des fichiers sources (mais pas trop)
+            unique_files = _count_unique_ids(picked_files)
+            if unique_files == 2:
+                score += 0.02
+            elif unique_files > 3:
+                score -= 0.05
+            
+            scores[c] = score
+        
+        return scores
+
+
 class SmartMixPlayer(MixPlayer):
     """Version améliorée du MixPlayer avec sélection contextuelle intelligente."""
     
@@ -103,21 +169,100 @@ class SmartMixPlayer(MixPlayer):
                                  same_speaker_bonus: float) -> List[WordMatch]:
         """Test toutes les combinaisons possibles pour trouver la meilleure séquence."""
         
-        import itertools
+        candidates = [all_matches[word][:10] for word in words]
+        if not all(candidates):
+            return []
+        
+        # Caractéristiques de chaque correspondance extraites une seule fois
+        features = self._match_features(candidates)
+        
+        # Toutes les combinaisons (même ordre que itertools.product) : (n_mots, n_combinaisons)
+        combinations = np.indices([len(c) for c in candidates]).reshape(len(candidates), -1)
+        
+        scores = self._score_combinations(features, combinations, max_time_gap, same_speaker_bonus)
+        best = combinations[:, int(np.argmax(scores))]
         
-        # Générer toutes les combinaisons possibles
-        combinations = list(itertools.product(*[all_matches[word][:10] for word in words]))
+        return [candidates[position][index] for position, index in enumerate(best)]
+    
+    def _match_features(self, candidates: List[List[WordMatch]]) -> Dict[str, np.ndarray]:
+        """
+        Convertit les correspondances candidates en tableaux (n_mots, max_candidats).
+        
+        Les locuteurs et fichiers sont remplacés par des identifiants entiers.
+        """
+        n = len(candidates)
+        width = max(len(c) for c in candidates)
+        speaker_ids: Dict[str, int] = {}
+        file_ids: Dict[str, int] = {}
+        
+        features = {
+            "confidence": np.zeros((n, width)),
+            "speaker": np.zeros((n, width), dtype=np.int64),
+            "file": np.zeros((n, width), dtype=np.int64),
+            "start": np.zeros((n, width)),
+            "end": np.zeros((n, width)),
+        }
+        
+        for position, matches in enumerate(candidates):
+            for index, match in enumerate(matches):
+                features["confidence"][position, index] = match.confidence
+                features["speaker"][position, index] = speaker_ids.setdefault(match.speaker, len(speaker_ids))
+                features["file"][position, index] = file_ids.setdefault(match.file_name, len(file_ids))
+                features["start"][position, index] = match.start
+                features["end"][position, index] = match.end
+        
+        return features
+    
+    def _score_combinations(self, features: Dict[str, np.ndarray],
+                            combinations: np.ndarray,
+                            max_time_gap: float,
+                            same_speaker_bonus: float) -> np.ndarray:
+        """Version vectorisée de _score_sequence appliquée à toutes les combinaisons."""
+        
+        if NUMBA_AVAILABLE:
+            return _score_combinations_jit(
+                features["confidence"], features["speaker"], features["file"],
+                features["start"], features["end"], combinations,
+                float(max_time_gap), float(same_speaker_bonus)
+            )
+        
+        n = combinations.shape[0]
+        rows = np.arange(n)[:, None]
         
-        best_sequence = None
-        best_score = -1
+        def pick(name: str) -> np.ndarray:
+            return features[name][rows, combinations]
         
-        for combination in combinations:
-            score = self._score_sequence(combination, max_time_gap, same_speaker_bonus)
-            if score > best_score:
-                best_score = score
-                best_sequence = combination
+        confidence, speakers, files = pick("confidence"), pick("speaker"), pick("file")
+        starts, ends = pick("start"), pick("end")
         
-        return list(best_sequence) if best_sequence else []
+        # Score de base : moyenne des confidences
+        scores = confidence.sum(axis=0) / n
+        
+        # Bonus pour la cohérence du locuteur
+        unique_speakers = self._count_unique(speakers)
+        scores += np.where(unique_speakers == 1, same_speaker_bonus * 2,
+                           np.where(unique_speakers == 2, same_speaker_bonus, 0.0))
+        
+        # Pénalité / bonus selon l'écart temporel entre mots consécutifs du même fichier
+        for i in range(n - 1):
+            same_file = files[i] == files[i + 1]
+            time_gap = np.abs(starts[i + 1] - ends[i])
+            penalty = np.minimum(0.2, time_gap / max_time_gap * 0.1)
+            proximity_bonus = np.maximum(0, (max_time_gap - time_gap) / max_time_gap * 0.05)
+            adjustment = np.where(time_gap > max_time_gap, -penalty, proximity_bonus)
+            scores += np.where(same_file, adjustment, 0.0)
+        
+        # Bonus pour la variété des fichiers sources (mais pas trop)
+        unique_files = self._count_unique(files)
+        scores += np.where(unique_files == 2, 0.02, np.where(unique_files > 3, -0.05, 0.0))
+        
+        return scores
+    
+    @staticmethod
+    def _count_unique(ids: np.ndarray) -> np.ndarray:
+        """Nombre de valeurs distinctes par colonne d'un tableau d'identifiants."""
+        sorted_ids = np.sort(ids, axis=0)
+        return 1 + (np.diff(sorted_ids, axis=0) != 0).sum(axis=0)
     
     def _greedy_contextual_sequence(self, words: List[str], 
                                   all_matches: Dict[str, List[WordMatch]],
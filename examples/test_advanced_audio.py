@@ -5,7 +5,11 @@ Ce script teste les différents modes de fondu et les ajustements de tempo
 pour créer des rendus plus artistiques et contrôlés.
 """
 
+import os
+import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -13,10 +17,59 @@ from datetime import datetime
 sys.path.append(str(Path(__file__).parent / "src"))
 
 from mix_player import MixPlayer
+from script_utils import run_quiet
 
+# Découpage en mots sans ponctuation (compilé une seule fois)
+_WORD_RE = re.compile(r'\b\w+\b')
 
-def test_advanced_audio_features():
-    """Test les nouvelles fonctionnalités audio avancées."""
+# Table de conversion des noms de variantes en noms de fichiers
+_SLUG_TABLE = str.maketrans({' ': '_', '(': None, ')': None})
+
+def slugify(name: str) -> str:
+    """Nom de fichier sécurisé : minuscules, espaces en '_', sans parenthèses."""
+    return name.lower().translate(_SLUG_TABLE)
+
+
+def _generate_group(indexed_configs, composed):
+    """
+    Génère dans un même thread les variantes qui partagent le même padding : mêmes
+    fenêtres de mots, donc extraits décodés et STFT réutilisés d'une variante à l'autre.
+    
+    Args:
+        indexed_configs: Liste de (index, config, chemin de sortie)
+        composed: La phrase composée
+        
+    Returns:
+        Liste de (index, nom, fichier généré, échantillons, erreur)
+    """
+    # MixPlayer propre au groupe : ses caches ne sont pas partagés entre threads
+    # (la phrase composée est transmise : pas besoin de recharger les transcriptions)
+    player = MixPlayer()
+    results = []
+    
+    for index, config, output_file in indexed_configs:
+        try:
+            audio_file = player.generate_mixed_audio(
+                composed,
+                output_file,
+                reuse_stft=True,  # STFT des mots partagées entre les variantes de tempo du groupe
+                mp3_quality=5,  # VBR rapide : suffisant pour l'écoute comparative
+                **config['params']
+            )
+            results.append((index, config['name'], audio_file, player.last_rendered_pcm, None))
+        except Exception as e:
+            results.append((index, config['name'], None, None, e))
+    
+    return results
+
+
+def test_advanced_audio_features(quiet: bool = False) -> bool:
+    """
+    Test les nouvelles fonctionnalités audio avancées (quiet : sans écoute interactive).
+    
+    Returns:
+        True si toutes les variantes ont été générées
+    """
     
     print("🎨 Test des Fonctionnalités Audio Avancées")
     print("=" * 45)
@@ -32,8 +85,7 @@ def test_advanced_audio_features():
     print()
     
     # Composer la phrase avec diversification des sources
-    import re
-    words = re.findall(r'\b\w+\b', test_phrase.lower())  # Nettoyer la ponctuation
+    words = _WORD_RE.findall(test_phrase.lower())  # Nettoyer la ponctuation
     
     composed = mix_player.compose_sentence(
         words,
@@ -42,8 +94,8 @@ def test_advanced_audio_features():
     )
     
     if not composed.words:
-        print("❌ Aucun mot trouvé pour cette phrase")
-        return
+        print("❌ Aucun mot trouvé pour cette phrase", file=sys.stderr)
+        return False
     
     print(f"✅ Composition: {composed.text}")
     print(f"🔤 {len(composed.words)} mots trouvés")
@@ -59,7 +111,7 @@ def test_advanced_audio_features():
             "params": {
                 "fade_mode": "standard",
                 "word_padding": 0.1,
-                "tempo_factor": 1.0,
+                "tempo_factor": 1.0,  # Chemin rapide : aucun étirement temporel
                 "gap_duration": 0.3,
                 "crossfade_duration": 50
             }
@@ -119,36 +171,44 @@ def test_advanced_audio_features():
         }
     ]
     
+    # Chemins de sortie construits une seule fois, avant la génération
+    output_paths = [
+        str(output_dir / f"advanced_{slugify(c['name'])}_{timestamp}.mp3")
+        for c in test_configs
+    ]
+    
     generated_files = []
     
     print("🎬 GÉNÉRATION DES VERSIONS DE TEST")
     print("-" * 35)
     
-    for i, config in enumerate(test_configs, 1):
-        print(f"\n{i}️⃣ Test: {config['name']}")
-        
-        # Nom de fichier sécurisé
-        safe_name = config['name'].lower().replace(' ', '_').replace('(', '').replace(')', '')
-        output_file = output_dir / f"advanced_{safe_name}_{timestamp}.mp3"
+    # Variantes regroupées par padding (mêmes extraits de mots) ; les groupes sont générés
+    # en parallèle dans des threads (le décodage et l'encodage tournent dans ffmpeg)
+    groups = defaultdict(list)
+    for index, (config, output_file) in enumerate(zip(test_configs, output_paths)):
+        groups[config['params']['word_padding']].append((index, config, output_file))
+    
+    n_workers = min(len(groups), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        group_results = list(executor.map(lambda group: _generate_group(group, composed), groups.values()))
+    
+    # Résultats remis dans l'ordre des variantes
+    results = sorted((result for group in group_results for result in group), key=lambda r: r[0])
+    
+    for i, (_, name, audio_file, pcm, error) in enumerate(results, 1):
+        print(f"\n{i}️⃣ Test: {name}")
         
-        try:
-            audio_file = mix_player.generate_mixed_audio(
-                composed,
-                str(output_file),
-                **config['params']
-            )
-            
-            generated_files.append((config['name'], audio_file))
+        if error is None:
+            generated_files.append((name, audio_file, pcm))
             print(f"✅ Généré: {Path(audio_file).name}")
-            
-        except Exception as e:
-            print(f"❌ Erreur pour {config['name']}: {e}")
+        else:
+            print(f"❌ Erreur pour {name}: {error}", file=sys.stderr)
     
     print(f"\n🎧 ÉCOUTE COMPARATIVE")
     print("-" * 25)
     print(f"{len(generated_files)} versions générées:")
     
-    for name, file_path in generated_files:
+    for name, file_path, _ in generated_files:
         print(f"• {name}: {Path(file_path).name}")
     
     print(f"\n💡 CONSEILS D'ÉCOUTE:")
@@ -159,36 +219,37 @@ def test_advanced_audio_features():
     print("• Tempo Très Lent: Effet hypnotique, chaque mot distinct")
     print("• Tempo Accéléré: Plus dynamique, effet énergique")
     
-    # Proposer d'écouter chaque version
-    print(f"\n🎵 ÉCOUTE INTERACTIVE")
-    print("-" * 20)
+    # Mode batch : pas d'invite ni de lecture
+    if not quiet:
+        # Proposer d'écouter chaque version
+        print(f"\n🎵 ÉCOUTE INTERACTIVE")
+        print("-" * 20)
     
-    for name, file_path in generated_files:
-        if Path(file_path).exists():
-            response = input(f"Écouter '{name}' ? (O/n/q pour quitter): ").strip().lower()
+        for name, file_path, pcm in generated_files:
+            if Path(file_path).exists():
+                response = input(f"Écouter '{name}' ? (O/n/q pour quitter): ").strip().lower()
             
-            if response == 'q':
-                break
-            elif response not in ['n', 'non', 'no']:
-                try:
-                    import subprocess
-                    import platform
-                    
-                    if platform.system() == "Darwin":  # macOS
-                        subprocess.run(["afplay", file_path])
-                        print("✅ Lecture terminée")
-                    else:
-                        print(f"📂 Ouvrez manuellement: {file_path}")
+                if response == 'q':
+                    break
+                elif response not in ['n', 'non', 'no']:
+                    try:
+                        # Lecture directe des échantillons en mémoire si possible (sans redécoder le MP3)
+                        if mix_player.play_audio(file_path, pcm):
+                            print("✅ Lecture terminée")
+                        else:
+                            print(f"📂 Ouvrez manuellement: {file_path}")
                         
-                except Exception as e:
-                    print(f"⚠️ Erreur de lecture: {e}")
-            print()
+                    except Exception as e:
+                        print(f"⚠️ Erreur de lecture: {e}")
+                print()
     
     print("🎨 RECOMMANDATIONS D'USAGE:")
     print("• Fondu artistique: Idéal pour créations poétiques/rêveuses")
     print("• Fondu seamless: Parfait pour narration naturelle")  
     print("• Tempo ralenti: Excellent pour compréhension/drama")
     print("• Combinaisons: Mélangez les modes selon l'effet souhaité")
+    
+    return len(generated_files) == len(test_configs)
 
 
 def test_librosa_availability():
@@ -205,6 +266,9 @@ def test_librosa_availability():
 
 
 if __name__ == "__main__":
+    if "--quiet" in sys.argv[1:]:
+        run_quiet(test_advanced_audio_features)
+    
     print("🔍 Vérification des dépendances...")
     librosa_available = test_librosa_availability()
     print()
@@ -12,10 +12,16 @@ from datetime import datetime
 sys.path.append(str(Path(__file__).parent / "src"))
 
 from mix_player import MixPlayer
+from script_utils import run_quiet
 
 
-def test_audio_quality():
-    """Test différentes configurations de qualité audio."""
+def test_audio_quality(quiet: bool = False) -> bool:
+    """
+    Test différentes configurations de qualité audio (quiet : première phrase, sans écoute).
+    
+    Returns:
+        True si les trois versions ont été générées
+    """
     
     print("🔊 Test de Qualité Audio Mix-Play")
     print("=" * 40)
@@ -37,8 +43,11 @@ def test_audio_quality():
         print(f"{i}. {phrase}")
     print()
     
-    # Laisser l'utilisateur choisir
-    while True:
+    # Laisser l'utilisateur choisir (première phrase en mode batch)
+    if quiet:
+        selected_phrase = test_phrases[0]
+    
+    while not quiet:
         try:
             choice = int(input(f"Choisissez une phrase (1-{len(test_phrases)}): ")) - 1
             if 0 <= choice < len(test_phrases):
@@ -59,8 +68,8 @@ def test_audio_quality():
     )
     
     if not composed.words:
-        print("❌ Aucun mot trouvé pour cette phrase")
-        return
+        print("❌ Aucun mot trouvé pour cette phrase", file=sys.stderr)
+        return False
     
     print(f"✅ Composition: {composed.text}")
     print(f"🔤 {len(composed.words)}/{len(words)} mots trouvés")
@@ -79,6 +88,7 @@ def test_audio_quality():
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_dir = Path("output_mix_play")
+    rendered_pcm = {}  # Échantillons de chaque rendu, pour l'écoute sans redécoder le MP3
     
     # Test 1: Configuration par défaut
     print("1️⃣ Test avec configuration par défaut...")
@@ -90,9 +100,10 @@ def test_audio_quality():
             crossfade_duration=50,
             word_padding=0.1
         )
+        rendered_pcm["default"] = mix_player.last_rendered_pcm
         print(f"✅ Généré: {audio1}")
     except Exception as e:
-        print(f"❌ Erreur: {e}")
+        print(f"❌ Erreur: {e}", file=sys.stderr)
     
     # Test 2: Plus de padding pour plus de contexte
     print(f"\n2️⃣ Test avec plus de contexte (padding 0.3s)...")
@@ -104,9 +115,10 @@ def test_audio_quality():
             crossfade_duration=30,
             word_padding=0.3  # Plus de contexte
         )
+        rendered_pcm["contextual"] = mix_player.last_rendered_pcm
         print(f"✅ Généré: {audio2}")
     except Exception as e:
-        print(f"❌ Erreur: {e}")
+        print(f"❌ Erreur: {e}", file=sys.stderr)
     
     # Test 3: Transitions douces
     print(f"\n3️⃣ Test avec transitions douces...")
@@ -119,9 +131,10 @@ def test_audio_quality():
             word_padding=0.2,
             normalize_volume=True
         )
+        rendered_pcm["smooth"] = mix_player.last_rendered_pcm
         print(f"✅ Généré: {audio3}")
     except Exception as e:
-        print(f"❌ Erreur: {e}")
+        print(f"❌ Erreur: {e}", file=sys.stderr)
     
     print(f"\n🎧 ÉCOUTE DES RÉSULTATS")
     print("-" * 25)
@@ -131,23 +144,22 @@ def test_audio_quality():
     print("• test_smooth: Transitions plus douces")
     print()
     
-    # Proposer d'écouter chaque version
-    for test_name in ["default", "contextual", "smooth"]:
-        file_path = output_dir / f"test_{test_name}_{timestamp}.mp3"
-        if file_path.exists():
-            response = input(f"🎵 Écouter test_{test_name} ? (O/n): ").strip().lower()
-            if response not in ['n', 'non', 'no']:
-                try:
-                    import subprocess
-                    import platform
-                    if platform.system() == "Darwin":  # macOS
-                        subprocess.run(["afplay", str(file_path)])
-                        print("✅ Lecture terminée")
-                    else:
-                        print(f"📂 Ouvrez manuellement: {file_path}")
-                except Exception as e:
-                    print(f"⚠️ Erreur de lecture: {e}")
-            print()
+    # Mode batch : pas d'invite ni de lecture
+    if not quiet:
+        # Proposer d'écouter chaque version
+        for test_name in ["default", "contextual", "smooth"]:
+            file_path = output_dir / f"test_{test_name}_{timestamp}.mp3"
+            if file_path.exists():
+                response = input(f"🎵 Écouter test_{test_name} ? (O/n): ").strip().lower()
+                if response not in ['n', 'non', 'no']:
+                    try:
+                        if mix_player.play_audio(str(file_path), rendered_pcm.get(test_name)):
+                            print("✅ Lecture terminée")
+                        else:
+                            print(f"📂 Ouvrez manuellement: {file_path}")
+                    except Exception as e:
+                        print(f"⚠️ Erreur de lecture: {e}")
+                print()
     
     print("💡 CONSEILS POUR AMÉLIORER LA QUALITÉ:")
     print("• Utilisez des mots plus courts et courants")
@@ -155,7 +167,12 @@ def test_audio_quality():
     print("• Ajustez le padding selon le contexte nécessaire")
     print("• Les transitions douces aident mais peuvent créer des artefacts")
     print("• Testez avec des intervenants similaires (même sexe, même âge)")
+    
+    return len(rendered_pcm) == 3
 
 
 if __name__ == "__main__":
-    test_audio_quality()
\ No newline at end of file
+    if "--quiet" in sys.argv[1:]:
+        run_quiet(test_audio_quality)
+    else:
+        test_audio_quality()
\ No newline at end of file
@@ -2,6 +2,7 @@
 Test corrigé des fonctionnalités audio avancées.
 """
 
+import re
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -10,10 +11,19 @@ from datetime import datetime
 sys.path.append(str(Path(__file__).parent / "src"))
 
 from mix_player import MixPlayer
+from script_utils import run_quiet
 
+# Découpage en mots sans ponctuation (compilé une seule fois)
+_WORD_RE = re.compile(r'\b\w+\b')
 
-def test_corrected_audio():
-    """Test des corrections audio."""
+
+def test_corrected_audio(fast: bool = False, quiet: bool = False) -> bool:
+    """
+    Test des corrections audio (fast : encodage MP3 plus rapide, quiet : sans écoute).
+    
+    Returns:
+        True si toutes les variantes ont été générées
+    """
     
     print("🔧 Test des Corrections Audio")
     print("=" * 35)
@@ -28,11 +38,11 @@ def test_corrected_audio():
     print(f"🎯 Phrase: {test_phrase}")
     
     # Composer
-    composed = mix_player.compose_sentence(test_phrase.split(), min_confidence=0.6)
+    composed = mix_player.compose_sentence(_WORD_RE.findall(test_phrase.lower()), min_confidence=0.6)
     
     if not composed.words:
-        print("❌ Aucun mot trouvé")
-        return
+        print("❌ Aucun mot trouvé", file=sys.stderr)
+        return False
     
     print(f"✅ {composed.text}")
     print()
@@ -65,7 +75,7 @@ def test_corrected_audio():
             "params": {
                 "fade_mode": "standard", 
                 "word_padding": 0.15,
-                "tempo_factor": 1.0  # Pas de changement
+                "tempo_factor": 1.0  # Pas de changement (chemin rapide, aucun étirement)
             }
         }
     ]
@@ -82,39 +92,42 @@ def test_corrected_audio():
             audio_file = mix_player.generate_mixed_audio(
                 composed,
                 output_file,
+                mp3_quality=7 if fast else 5,
                 **test['params']
             )
             
-            generated_files.append((test['name'], audio_file))
+            generated_files.append((test['name'], audio_file, mix_player.last_rendered_pcm))
             print(f"   ✅ Généré: {Path(audio_file).name}")
             
         except Exception as e:
-            print(f"   ❌ Erreur: {e}")
+            print(f"   ❌ Erreur: {e}", file=sys.stderr)
         
         print()
     
-    # Écoute
-    print("🎧 ÉCOUTE DES CORRECTIONS:")
-    for name, file_path in generated_files:
-        if Path(file_path).exists():
-            listen = input(f"Écouter '{name}' ? (O/n/q): ").strip().lower()
-            if listen == 'q':
-                break
-            elif listen not in ['n', 'non', 'no']:
-                try:
-                    import subprocess
-                    import platform
-                    if platform.system() == "Darwin":
-                        subprocess.run(["afplay", file_path])
-                        print("✅ Terminé")
-                except Exception as e:
-                    print(f"⚠️ Erreur lecture: {e}")
-            print()
+    # Mode batch : pas d'invite ni de lecture
+    if not quiet:
+        # Écoute
+        print("🎧 ÉCOUTE DES CORRECTIONS:")
+        for name, file_path, pcm in generated_files:
+            if Path(file_path).exists():
+                listen = input(f"Écouter '{name}' ? (O/n/q): ").strip().lower()
+                if listen == 'q':
+                    break
+                elif listen not in ['n', 'non', 'no']:
+                    try:
+                        # Lecture directe des échantillons en mémoire si possible (sans redécoder le MP3)
+                        if mix_player.play_audio(file_path, pcm):
+                            print("✅ Terminé")
+                    except Exception as e:
+                        print(f"⚠️ Erreur lecture: {e}")
+                print()
     
     print("💡 Corrections apportées:")
-    print("• Tempo: Méthode par fichiers temporaires (plus robuste)")
+    print("• Tempo: Traitement en mémoire, sans fichiers temporaires (Rubber Band, ffmpeg atempo ou librosa)")
     print("• Fondu artistique: Augmenté à 300-500ms")
     print("• Mode seamless: Réduit à 15ms (supprimé des tests)")
+    
+    return len(generated_files) == len(tests)
 
 
 def check_dependencies():
@@ -142,6 +155,10 @@ def check_dependencies():
 
 
 if __name__ == "__main__":
+    fast = "--fast" in sys.argv[1:]
+    if "--quiet" in sys.argv[1:]:
+        run_quiet(test_corrected_audio, fast=fast)
+    
     print("🔍 Vérification des dépendances...")
     deps_ok = check_dependencies()
     print()
@@ -156,4 +173,4 @@ if __name__ == "__main__":
             except:
                 print("❌ Échec installation")
     
-    test_corrected_audio()
\ No newline at end of file
+    test_corrected_audio(fast=fast)
\ No newline at end of file
@@ -83,20 +83,24 @@ def test_transcription_with_gpu():
     
     export_manager = ExportManager()
     
-    # Traiter chaque fichier
-    for i, audio_file in enumerate(audio_files, 1):
+    # Transcription de tous les fichiers (préparation des suivants pendant l'inférence)
+    results = transcriber.transcribe_batch(
+        [str(f) for f in audio_files],
+        word_timestamps=True,
+        batch_size=min(len(audio_files), 8)
+    )
+    
+    # Exporter chaque résultat
+    for i, (audio_file, result) in enumerate(zip(audio_files, results), 1):
         print(f"\n" + "="*60)
         print(f"🎵 TRANSCRIPTION {i}/{len(audio_files)}: {audio_file.name}")
         print(f"📱 Dispositif actuel : {transcriber.actual_device}")
         print("="*60)
         
+        if result is None:
+            continue
+        
         try:
-            # Transcription
-            result = transcriber.transcribe_with_timestamps(
-                str(audio_file), 
-                word_timestamps=True
-            )
-            
             # Nom de fichier de sortie basé sur le nom d'entrée
             base_name = audio_file.stem.replace(" ", "_").lower()
             
@@ -3,6 +3,7 @@
 Test de l'analyse d'amour sur un fichier audio existant.
 """
 
+import heapq
 import sys
 import os
 from pathlib import Path
@@ -13,10 +14,16 @@ src_dir = current_dir / 'src'
 sys.path.insert(0, str(src_dir))
 
 from love_analyzer import LoveTypeAnalyzer
+from script_utils import load_json
 
 
-def test_love_analysis_on_existing_data():
-    """Test l'analyse d'amour sur des données JSON existantes."""
+def test_love_analysis_on_existing_data(use_semantic: bool = False):
+    """
+    Test l'analyse d'amour sur des données JSON existantes.
+    
+    Par défaut sans modèle sémantique (chargement évité) : le chemin sémantique
+    est testé par test_semantic_analysis.py.
+    """
     # Chercher des fichiers JSON existants
     output_dirs = [
         Path("output"),
@@ -39,18 +46,15 @@ def test_love_analysis_on_existing_data():
     print("=" * 60)
     
     try:
-        import json
-        
         # Charger les données
-        with open(test_file, 'r', encoding='utf-8') as f:
-            transcription_data = json.load(f)
+        transcription_data = load_json(test_file)
         
         print(f"✅ Données chargées : {len(transcription_data['transcription']['segments'])} segments")
         
         # Analyser
         print("💕 Lancement de l'analyse d'amour...")
         
-        analyzer = LoveTypeAnalyzer(min_score_threshold=0.05)
+        analyzer = LoveTypeAnalyzer(min_score_threshold=0.05, use_semantic_analysis=use_semantic)
         enriched_data = analyzer.analyze_transcription(transcription_data)
         
         print("✅ Analyse terminée !")
@@ -100,7 +104,7 @@ def test_love_analysis_on_existing_data():
                 segments_with_love.append(segment)
         
         # Top 5 des segments avec le plus d'amour
-        top_segments = sorted(segments_with_love, key=lambda x: x.get('love_confidence', 0), reverse=True)[:5]
+        top_segments = heapq.nlargest(5, segments_with_love, key=lambda x: x.get('love_confidence', 0))
         
         for i, segment in enumerate(top_segments, 1):
             print(f"{i}. Type dominant: {segment.get('dominant_love_type', 'inconnu')}")
@@ -127,4 +131,5 @@ def test_love_analysis_on_existing_data():
 
 
 if __name__ == "__main__":
-    test_love_analysis_on_existing_data()
\ No newline at end of file
+    # --semantic : charger aussi le modèle sentence-transformers
+    test_love_analysis_on_existing_data(use_semantic="--semantic" in sys.argv)
\ No newline at end of file
@@ -6,17 +6,27 @@ Usage: python test_phrase.py "ta phrase ici"
 """
 
 import sys
+import platform
+import subprocess
 from pathlib import Path
 import re
 from datetime import datetime
+from typing import Optional
 
 # Ajouter le répertoire src au path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
 from mix_player import MixPlayer
 
-def test_phrase(phrase: str, show_details: bool = True):
-    """Teste une phrase directement"""
+# Découpage en mots sans ponctuation (compilé une seule fois)
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Dernière lecture lancée sans attente (appeler .wait() pour attendre la fin)
+last_playback: Optional[subprocess.Popen] = None
+
+def test_phrase(phrase: str, show_details: bool = True, wait: bool = True):
+    """Teste une phrase directement (wait=False : lecture en arrière-plan, retour immédiat)"""
+    global last_playback
     
     if show_details:
         print(f"🎯 Test de: {phrase}")
@@ -27,7 +37,7 @@ def test_phrase(phrase: str, show_details: bool = True):
     mix_player.load_transcriptions()
     
     # Nettoyer et composer
-    words = re.findall(r'\b\w+\b', phrase.lower())
+    words = _WORD_RE.findall(phrase.lower())
     
     composed = mix_player.compose_sentence(
         words,
@@ -58,12 +68,14 @@ def test_phrase(phrase: str, show_details: bool = True):
         print(f"✅ Audio généré: {filename}")
         
         # Lecture automatique sur macOS
-        import platform
         if platform.system() == "Darwin":
             try:
-                import subprocess
-                subprocess.run(["afplay", audio_file], check=True)
-                print("🎵 Lecture terminée")
+                if wait:
+                    subprocess.run(["afplay", audio_file], check=True)
+                    print("🎵 Lecture terminée")
+                else:
+                    last_playback = subprocess.Popen(["afplay", audio_file], stdout=subprocess.DEVNULL)
+                    print("🎵 Lecture en arrière-plan")
             except:
                 print(f"📂 Fichier: {audio_file}")
         
@@ -74,12 +86,16 @@ def test_phrase(phrase: str, show_details: bool = True):
         return None
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python test_phrase.py \"votre phrase ici\"")
+    # --no-wait : ne pas bloquer pendant la lecture
+    wait = "--no-wait" not in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != "--no-wait"]
+    
+    if not args:
+        print("Usage: python test_phrase.py [--no-wait] \"votre phrase ici\"")
         print("\nExemples:")
         print("  python test_phrase.py \"bonjour comment allez vous\"")
         print("  python test_phrase.py \"avec tout mon amour je te dis bonjour\"")
         sys.exit(1)
     
-    phrase = " ".join(sys.argv[1:])
-    test_phrase(phrase)
\ No newline at end of file
+    phrase = " ".join(args)
+    test_phrase(phrase, wait=wait)
\ No newline at end of file
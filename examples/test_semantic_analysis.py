@@ -3,8 +3,8 @@
 Test de l'analyse d'amour avec sentence-transformers.
 """
 
+import heapq
 import sys
-import os
 from pathlib import Path
 
 # Ajouter src au PATH
@@ -13,30 +13,25 @@ src_dir = current_dir / 'src'
 sys.path.insert(0, str(src_dir))
 
 from love_analyzer import LoveTypeAnalyzer
+from script_utils import load_json
 
 
-def test_semantic_analysis():
-    """Test l'analyse sémantique avec des exemples."""
+def test_semantic_analysis(int8: bool = False):
+    """Test l'analyse sémantique avec des exemples (int8 : encodeur quantifié)."""
     print("🧪 Test de l'analyse sémantique avec sentence-transformers")
     print("=" * 70)
     
-    # Tenter d'installer sentence-transformers si nécessaire
+    # sentence-transformers est requis (pip install sentence-transformers) : sinon test ignoré
     try:
         import sentence_transformers
         print("✅ sentence-transformers disponible")
     except ImportError:
-        print("⚠️  sentence-transformers non installé. Installation en cours...")
-        os.system("pip install sentence-transformers")
-        try:
-            import sentence_transformers
-            print("✅ sentence-transformers installé avec succès")
-        except ImportError:
-            print("❌ Impossible d'installer sentence-transformers")
-            return
+        print("⏭️  sentence-transformers non installé (pip install sentence-transformers) - test ignoré")
+        return
     
-    # Initialiser l'analyseur avec sémantique activée
-    print("\n🤖 Initialisation de l'analyseur avec analyse sémantique...")
-    analyzer = LoveTypeAnalyzer(min_score_threshold=0.05, use_semantic_analysis=True)
+    # Initialiser l'analyseur avec sémantique activée (float32 par défaut, int8 avec --int8)
+    print(f"\n🤖 Initialisation de l'analyseur avec analyse sémantique ({'int8' if int8 else 'float32'})...")
+    analyzer = LoveTypeAnalyzer(min_score_threshold=0.05, use_semantic_analysis=True, int8=int8)
     
     # Phrases de test pour différents types d'amour
     test_phrases = [
@@ -79,25 +74,23 @@ def test_semantic_analysis():
     correct_predictions = 0
     total_tests = len(test_phrases)
     
-    for i, (phrase, expected_type) in enumerate(test_phrases, 1):
+    # Analyser toutes les phrases en un seul lot (un seul passage de l'encodeur)
+    scores_all = analyzer.analyze_segments_batch([phrase for phrase, _ in test_phrases])
+    
+    for i, ((phrase, expected_type), scores) in enumerate(zip(test_phrases, scores_all), 1):
         print(f"\n{i}. Phrase: \"{phrase}\"")
         print(f"   Type attendu: {expected_type}")
         
-        # Analyser
-        scores = analyzer.analyze_segment(phrase)
-        
-        # Trouver le type dominant
-        if max(scores.values()) > analyzer.min_score_threshold:
-            dominant_type = max(scores, key=scores.get)
-            confidence = scores[dominant_type]
-        else:
+        # Top 3 des scores en une passe : le premier est le type dominant
+        sorted_scores = heapq.nlargest(3, scores.items(), key=lambda kv: kv[1])
+        dominant_type, confidence = sorted_scores[0]
+        if confidence <= analyzer.min_score_threshold:
             dominant_type = "neutre"
             confidence = 0.0
         
         print(f"   Type détecté: {dominant_type} (confiance: {confidence:.3f})")
         
         # Afficher les top 3 des scores
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:3]
         print(f"   Top 3 scores: {', '.join([f'{t}:{s:.3f}' for t, s in sorted_scores])}")
         
         # Vérifier la prédiction
@@ -132,8 +125,6 @@ def test_semantic_analysis():
 
 def test_with_real_data(analyzer):
     """Test sur des données de transcription réelles."""
-    import json
-    
     # Chercher des fichiers JSON existants
     output_dirs = [
         Path("output"),
@@ -155,19 +146,17 @@ def test_with_real_data(analyzer):
     print(f"📁 Analyse du fichier: {test_file.name}")
     
     try:
-        with open(test_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json(test_file)
         
         segments = data['transcription']['segments'][:10]  # Analyser seulement 10 segments
         
         total_love_detected = 0
-        for i, segment in enumerate(segments, 1):
+        scores_all = analyzer.analyze_segments_batch([segment['text'] for segment in segments])
+        for i, (segment, scores) in enumerate(zip(segments, scores_all), 1):
             text = segment['text']
-            scores = analyzer.analyze_segment(text)
             
-            max_score = max(scores.values())
+            dominant_type, max_score = max(scores.items(), key=lambda kv: kv[1])
             if max_score > analyzer.min_score_threshold:
-                dominant_type = max(scores, key=scores.get)
                 total_love_detected += 1
                 
                 print(f"{i}. \"{text[:60]}{'...' if len(text) > 60 else ''}\"")
@@ -182,4 +171,4 @@ def test_with_real_data(analyzer):
 
 
 if __name__ == "__main__":
-    test_semantic_analysis()
\ No newline at end of file
+    test_semantic_analysis(int8="--int8" in sys.argv[1:])
\ No newline at end of file
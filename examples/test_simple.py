@@ -6,6 +6,7 @@ Version stable qui fonctionne de manière fiable.
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Ajouter le répertoire src au path
@@ -46,54 +47,61 @@ def test_simple_transcription():
     
     print("\n" + "=" * 70)
     
+    # Initialiser le transcripteur une seule fois pour tous les fichiers
+    # (auto-détection : GPU Apple Silicon / CUDA si disponible, sinon CPU)
+    transcriber = AudioTranscriber(
+        model_name="medium",
+        language="fr",
+        device=None,
+        verbose=False
+    )
+    precision = "float16" if transcriber.fp16 else "float32"
+    print(f"🖥️  Inférence sur {transcriber.actual_device} en {precision}")
+    
+    # Transcription (décodage des fichiers suivants pendant l'inférence du fichier courant)
+    print("🔄 Transcription en cours...")
+    transcriptions = transcriber.transcribe_batch(
+        [str(f) for f in audio_files],
+        word_timestamps=True,
+        batch_size=2
+    )
+    
+    # Gestionnaire d'export partagé entre les fichiers
+    export_manager = ExportManager()
+    
     # Traiter chaque fichier
     results = []
     
-    for i, audio_file in enumerate(audio_files, 1):
+    for i, (audio_file, result) in enumerate(zip(audio_files, transcriptions), 1):
         print(f"\n🎵 FICHIER {i}/{len(audio_files)} : {audio_file.name}")
         print("=" * 70)
         
+        if result is None:
+            # Échec déjà signalé : le modèle reste chargé pour les fichiers suivants
+            continue
+        
         try:
-            # Initialiser le transcripteur (CPU seulement pour stabilité)
-            transcriber = AudioTranscriber(
-                model_name="medium",
-                language="fr",
-                device="cpu",  # CPU pour éviter les problèmes MPS
-                verbose=False
-            )
-            
-            # Transcription
-            print("🔄 Transcription en cours...")
-            result = transcriber.transcribe_with_timestamps(
-                str(audio_file),
-                word_timestamps=True
-            )
-            
             # Générer un nom de fichier de sortie propre
             output_name = audio_file.stem.lower().replace(" ", "_")
             
-            # Export
-            export_manager = ExportManager()
-            
-            # JSON complet
-            json_file = output_dir / f"{output_name}_complete.json"
-            export_manager.export_json(result, str(json_file))
-            
-            # CSV pour analyse
-            csv_file = output_dir / f"{output_name}_data.csv"
-            export_manager.export_csv(result, str(csv_file))
-            
-            # Format artistique
-            artistic_file = output_dir / f"{output_name}_artistic.json"
-            export_manager.export_artistic_format(result, str(artistic_file))
-            
-            # Sous-titres
-            srt_file = output_dir / f"{output_name}_subtitles.srt"
-            export_manager.export_srt_subtitles(result, str(srt_file))
+            exports = [
+                # JSON complet
+                (export_manager.export_json, output_dir / f"{output_name}_complete.json"),
+                # CSV pour analyse
+                (export_manager.export_csv, output_dir / f"{output_name}_data.csv"),
+                # Format artistique
+                (export_manager.export_artistic_format, output_dir / f"{output_name}_artistic.json"),
+                # Sous-titres
+                (export_manager.export_srt_subtitles, output_dir / f"{output_name}_subtitles.srt"),
+                # Mots uniquement (format simple)
+                (export_manager.export_words_only, output_dir / f"{output_name}_words.json"),
+            ]
             
-            # Mots uniquement (format simple)
-            words_file = output_dir / f"{output_name}_words.json"
-            export_manager.export_words_only(result, str(words_file))
+            # Exports indépendants (lecture seule du résultat) : écrits en parallèle
+            with ThreadPoolExecutor(max_workers=len(exports)) as executor:
+                futures = [executor.submit(export, result, str(path)) for export, path in exports]
+                for future in futures:
+                    future.result()  # Propage la première erreur d'export
             
             # Statistiques
             print_stats(result)
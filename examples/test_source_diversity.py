@@ -6,22 +6,33 @@ Valide que les mots répétés proviennent de sources différentes
 """
 
 import sys
+from collections import Counter, defaultdict
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+
 # Ajouter le répertoire src au path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
 from mix_player import MixPlayer
 
-def test_source_diversity():
+
+@lru_cache(maxsize=None)
+def _source_key(file_name: str, speaker: str) -> str:
+    """Identifiant d'une source (fichier + intervenant), calculé une fois par couple"""
+    return f"{Path(file_name).stem}_{speaker}"
+
+def test_source_diversity(mix_player: MixPlayer = None):
     """Test la diversité des sources avec des mots répétés"""
     
     print("🔄 TEST DE DIVERSIFICATION DES SOURCES")
     print("=" * 40)
     
-    # Initialiser le MixPlayer
-    mix_player = MixPlayer()
-    mix_player.load_transcriptions()
+    # Initialiser le MixPlayer (sauf s'il est partagé par l'appelant)
+    if mix_player is None:
+        mix_player = MixPlayer()
+        mix_player.load_transcriptions()
     
     # Phrase avec des mots répétés pour tester la diversification
     test_phrases = [
@@ -76,20 +87,17 @@ def analyze_diversity(composed, mode_name):
         return
     
     # Compter les sources utilisées
-    source_usage = {}
-    word_details = {}
+    source_usage = Counter()
+    word_details = defaultdict(list)
     
     for i, word_match in enumerate(composed.words):
-        source_key = f"{Path(word_match.file_name).stem}_{word_match.speaker}"
+        source_key = _source_key(word_match.file_name, word_match.speaker)
         word = word_match.word.strip()
         
         # Compter l'usage des sources
-        source_usage[source_key] = source_usage.get(source_key, 0) + 1
+        source_usage[source_key] += 1
         
         # Enregistrer les détails pour chaque mot
-        if word not in word_details:
-            word_details[word] = []
-        
         word_details[word].append({
             'source': source_key,
             'position': i + 1,
@@ -135,11 +143,10 @@ def analyze_diversity(composed, mode_name):
     # Score global de diversification
     if source_usage:
         total_words = sum(source_usage.values())
-        ideal_distribution = total_words / len(source_usage)
         
-        # Calculer l'écart-type pour mesurer la distribution
-        variance = sum((count - ideal_distribution) ** 2 for count in source_usage.values()) / len(source_usage)
-        std_dev = variance ** 0.5
+        # Calculer l'écart-type pour mesurer la distribution (écart à la moyenne idéale)
+        counts = np.fromiter(source_usage.values(), dtype=np.float64, count=len(source_usage))
+        std_dev = counts.std()
         
         # Score de diversification (0-100, 100 = parfaitement distribué)
         max_possible_std = (total_words - 1) / 2  # Pire cas théorique
@@ -148,14 +155,15 @@ def analyze_diversity(composed, mode_name):
         score_emoji = "🌟" if diversity_score >= 80 else "👍" if diversity_score >= 60 else "⚠️"
         print(f"{score_emoji} Score de diversification: {diversity_score:.1f}%")
 
-def compare_algorithms():
+def compare_algorithms(mix_player: MixPlayer = None):
     """Compare les deux approches côte à côte"""
     
     print("\n⚖️ COMPARAISON DIRECTE DES ALGORITHMES")
     print("=" * 45)
     
-    mix_player = MixPlayer()
-    mix_player.load_transcriptions()
+    if mix_player is None:
+        mix_player = MixPlayer()
+        mix_player.load_transcriptions()
     
     # Phrase avec répétitions pour test optimal
     test_phrase = "avec tout mon amour avec tout mon amour je vois la vie"
@@ -183,8 +191,8 @@ def compare_algorithms():
     # Comparaison finale
     print("🏆 VERDICT:")
     if composed_diverse.words and composed_standard.words:
-        diverse_sources = len(set(f"{Path(w.file_name).stem}_{w.speaker}" for w in composed_diverse.words))
-        standard_sources = len(set(f"{Path(w.file_name).stem}_{w.speaker}" for w in composed_standard.words))
+        diverse_sources = len({_source_key(w.file_name, w.speaker) for w in composed_diverse.words})
+        standard_sources = len({_source_key(w.file_name, w.speaker) for w in composed_standard.words})
         
         print(f"   Diversifié: {diverse_sources} sources différentes")
         print(f"   Standard: {standard_sources} sources différentes")
@@ -197,5 +205,9 @@ def compare_algorithms():
             print("   ⚠️ L'algorithme standard était déjà assez diversifié")
 
 if __name__ == "__main__":
-    test_source_diversity()
-    compare_algorithms()
\ No newline at end of file
+    # Transcriptions chargées et indexées une seule fois pour les deux tests
+    mix_player = MixPlayer()
+    mix_player.load_transcriptions()
+    
+    test_source_diversity(mix_player)
+    compare_algorithms(mix_player)
\ No newline at end of file
@@ -4,12 +4,22 @@ Script de test avec détection d'intervenants simplifiée et stable.
 Utilise une méthode acoustique pour identifier les différents locuteurs.
 """
 
+import os
+import queue
 import sys
+import threading
+from collections import defaultdict
 from pathlib import Path
 
 # Ajouter le répertoire src au path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Table de traduction pour les noms de sortie (espaces → "_"), en une seule passe
+_SANITIZE = str.maketrans({" ": "_"})
+
+# Extensions audio reconnues
+AUDIO_EXTENSIONS = frozenset({'.mp3', '.wav', '.m4a', '.flac', '.ogg'})
+
 from simple_transcriber_with_speakers import SimpleAudioTranscriberWithSpeakers
 from export import ExportManager
 
@@ -30,9 +40,10 @@ def test_with_simple_speakers():
     audio_files = []
     
     if audio_dir.exists():
-        for file_path in audio_dir.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in ['.mp3', '.wav', '.m4a', '.flac', '.ogg']:
-                audio_files.append(file_path)
+        # scandir fournit le type de fichier depuis la lecture du dossier (pas de stat par fichier)
+        with os.scandir(audio_dir) as entries:
+            audio_files = [Path(entry.path) for entry in entries
+                           if entry.is_file() and os.path.splitext(entry.name)[1].lower() in AUDIO_EXTENSIONS]
     
     if not audio_files:
         print("❌ Aucun fichier audio trouvé")
@@ -44,32 +55,80 @@ def test_with_simple_speakers():
     
     print("\n" + "=" * 70)
     
-    # Traitement
+    # Transcripteur avec détection d'intervenants (modèle chargé une seule fois)
+    transcriber = SimpleAudioTranscriberWithSpeakers(
+        model_name="medium",
+        language="fr",
+        enable_speaker_detection=True
+    )
+    export_manager = ExportManager()
+    
+    # Exports écrits par un thread dédié : les transcriptions suivantes n'attendent pas le disque
+    export_queue = queue.Queue(maxsize=2)
+    writer = threading.Thread(
+        target=export_worker,
+        args=(export_queue, export_manager, output_dir),
+        daemon=True
+    )
+    writer.start()
+    
+    # Transcriptions une par une : le modèle Whisper partagé n'est pas réentrant
+    # (ses hooks de cache clé/valeur sont posés sur le modèle à chaque décodage)
+    file_results = []
+    for audio_file in audio_files:
+        result = transcribe_file(audio_file, transcriber)
+        file_results.append(result)
+        if result is not None:
+            # Nom de fichier propre
+            output_name = audio_file.stem.lower().translate(_SANITIZE)
+            export_queue.put((result, output_name))
+    
+    # Attendre la fin des exports
+    export_queue.put(None)
+    export_queue.join()
+    
+    # Statistiques dans l'ordre des fichiers
     results = []
     
-    for i, audio_file in enumerate(audio_files, 1):
+    for i, (audio_file, result) in enumerate(zip(audio_files, file_results), 1):
         print(f"\n🎵 FICHIER {i}/{len(audio_files)} : {audio_file.name}")
         print("=" * 70)
         
+        if result is None:
+            continue
+        
+        # Statistiques détaillées
+        print_detailed_stats(result)
+        
+        results.append((audio_file.name, result))
+    
+    # Résumé final
+    print_final_summary(results)
+
+
+def transcribe_file(audio_file, transcriber):
+    """Transcrit un fichier audio avec intervenants (None en cas d'erreur)."""
+    try:
+        return transcriber.transcribe_with_simple_speakers(
+            str(audio_file),
+            word_timestamps=True
+        )
+    except Exception as e:
+        print(f"❌ Erreur ({audio_file.name}) : {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+
+
+def export_worker(export_queue, export_manager, output_dir):
+    """Consomme les résultats (result, output_name) et écrit leurs exports, jusqu'à None."""
+    while True:
+        item = export_queue.get()
         try:
-            # Transcripteur avec détection d'intervenants
-            transcriber = SimpleAudioTranscriberWithSpeakers(
-                model_name="medium",
-                language="fr",
-                enable_speaker_detection=True
-            )
-            
-            # Transcription
-            result = transcriber.transcribe_with_simple_speakers(
-                str(audio_file),
-                word_timestamps=True
-            )
-            
-            # Nom de fichier propre
-            output_name = audio_file.stem.lower().replace(" ", "_").replace("par", "par")
+            if item is None:
+                return
             
-            # Export
-            export_manager = ExportManager()
+            result, output_name = item
             
             # JSON complet avec intervenants
             json_file = output_dir / f"{output_name}_with_speakers_complete.json"
@@ -87,42 +146,38 @@ def test_with_simple_speakers():
             srt_file = output_dir / f"{output_name}_with_speakers_subtitles.srt"
             export_srt_with_speakers(result, str(srt_file))
             
-            # Statistiques détaillées
-            print_detailed_stats(result)
-            
-            results.append((audio_file.name, result))
-            
         except Exception as e:
-            print(f"❌ Erreur : {e}")
-            import traceback
-            traceback.print_exc()
-    
-    # Résumé final
-    print_final_summary(results)
+            print(f"❌ Erreur d'export : {e}")
+        finally:
+            export_queue.task_done()
 
 
 def export_srt_with_speakers(transcription_data, output_path):
     """Export SRT avec indication des intervenants."""
     try:
         def format_time(seconds):
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            secs = int(seconds % 60)
-            millis = int((seconds % 1) * 1000)
+            # Millisecondes entières calculées une fois, puis découpées par divmod
+            secs, millis = divmod(int(seconds * 1000), 1000)
+            minutes, secs = divmod(secs, 60)
+            hours, minutes = divmod(minutes, 60)
             return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
         
+        # Blocs SRT assemblés en mémoire puis écrits en une seule fois
+        parts = []
+        for i, segment in enumerate(transcription_data["transcription"]["segments"], 1):
+            start_time = format_time(segment["start"])
+            end_time = format_time(segment["end"])
+            speaker = segment.get("speaker", "Inconnu")
+            text = segment["text"].strip()
+            
+            # Ajouter le nom de l'intervenant
+            if speaker and speaker != "Inconnu":
+                text = f"[{speaker}] {text}"
+            
+            parts.append(f"{i}\n{start_time} --> {end_time}\n{text}\n\n")
+        
         with open(output_path, 'w', encoding='utf-8') as f:
-            for i, segment in enumerate(transcription_data["transcription"]["segments"], 1):
-                start_time = format_time(segment["start"])
-                end_time = format_time(segment["end"])
-                speaker = segment.get("speaker", "Inconnu")
-                text = segment["text"].strip()
-                
-                # Ajouter le nom de l'intervenant
-                if speaker and speaker != "Inconnu":
-                    text = f"[{speaker}] {text}"
-                
-                f.write(f"{i}\n{start_time} --> {end_time}\n{text}\n\n")
+            f.write("".join(parts))
         
         print(f"📺 Sous-titres avec intervenants : {Path(output_path).name}")
         
@@ -154,18 +209,18 @@ def print_detailed_stats(result):
             if 'segments_count' in info:
                 print(f"     - Interventions : {info['segments_count']}")
     
-    # Distribution des mots par intervenant
-    total_words = sum(len(seg.get("words", [])) for seg in segments)
+    # Distribution des mots par intervenant (total et répartition en une passe)
+    total_words = 0
+    speaker_words = defaultdict(int)
+    for segment in segments:
+        word_count = len(segment.get("words", []))
+        total_words += word_count
+        speaker_words[segment.get("speaker", "Inconnu")] += word_count
+    
     if total_words > 0:
         print(f"\n🔤 RÉPARTITION DES MOTS :")
         print(f"   • Total : {total_words}")
         
-        speaker_words = {}
-        for segment in segments:
-            speaker = segment.get("speaker", "Inconnu")
-            word_count = len(segment.get("words", []))
-            speaker_words[speaker] = speaker_words.get(speaker, 0) + word_count
-        
         for speaker, count in speaker_words.items():
             percentage = (count / total_words) * 100
             print(f"   • {speaker} : {count} mots ({percentage:.1f}%)")
@@ -183,13 +238,14 @@ def print_final_summary(results):
     
     print(f"✅ Fichiers traités : {len(results)}")
     
-    # Correction de l'accès aux données des résultats
-    total_duration = sum(result["metadata"]["duration"] for _, result in results)
-    total_speakers = sum(len(result["speakers"]) for _, result in results)
-    total_words = sum(
-        sum(len(seg.get("words", [])) for seg in result["transcription"]["segments"])
-        for _, result in results
-    )
+    # Totaux accumulés en une seule passe sur les résultats
+    total_duration = 0.0
+    total_speakers = 0
+    total_words = 0
+    for _, result in results:
+        total_duration += result["metadata"]["duration"]
+        total_speakers += len(result["speakers"])
+        total_words += sum(len(seg.get("words", ())) for seg in result["transcription"]["segments"])
     
     print(f"⏱️  Durée totale : {total_duration:.1f}s")
     print(f"👥 Total d'intervenants détectés : {total_speakers}")
@@ -64,7 +64,9 @@ def test_tempo_correction():
                 word_padding=0.15,
                 tempo_factor=factor,
                 preserve_pitch=True,
-                gap_duration=0.2
+                gap_duration=0.2,
+                tempo_backend="librosa",
+                reuse_stft=True  # STFT du mot calculée une fois pour les quatre tempos
             )
             
             print(f"   ✅ Généré: {Path(audio_file).name}")
@@ -98,7 +100,7 @@ def test_tempo_correction():
     print("• Utilisation de fichiers temporaires WAV")
     print("• Import/export avec librosa + soundfile")
     print("• Gestion robuste des erreurs")
-    print("• Préservation du pitch avec time_stretch")
+    print("• Préservation du pitch avec le vocodeur de phase (STFT réutilisée entre tempos)")
 
 
 if __name__ == "__main__":
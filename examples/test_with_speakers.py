@@ -6,15 +6,26 @@ Lance automatiquement la transcription de tous les fichiers avec analyse des int
 
 import sys
 import os
+from functools import lru_cache
 from pathlib import Path
 import torch
 
 # Ajouter le répertoire src au path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Table de traduction pour les noms de sortie (espaces → "_"), en une seule passe
+_SANITIZE = str.maketrans({" ": "_"})
 
+# Extensions audio reconnues
+AUDIO_EXTENSIONS = frozenset({'.mp3', '.wav', '.m4a', '.flac', '.ogg'})
+
+# Support MPS résolu une fois à l'import (évite les hasattr répétés)
+MPS_BACKEND_AVAILABLE = hasattr(torch.backends, 'mps')
+
+
+@lru_cache(maxsize=1)
 def check_gpu_availability():
-    """Vérifie la disponibilité des GPU."""
+    """Vérifie la disponibilité des GPU (une seule interrogation des pilotes par processus)."""
     print("🔍 Vérification des dispositifs disponibles :")
     
     # PyTorch version
@@ -25,15 +36,16 @@ def check_gpu_availability():
     
     # CUDA (NVIDIA)
     if torch.cuda.is_available():
-        print(f"✅ CUDA disponible - {torch.cuda.device_count()} GPU(s)")
-        for i in range(torch.cuda.device_count()):
+        device_count = torch.cuda.device_count()
+        print(f"✅ CUDA disponible - {device_count} GPU(s)")
+        for i in range(device_count):
             print(f"   GPU {i}: {torch.cuda.get_device_name(i)}")
         return "cuda"
     else:
         print("❌ CUDA non disponible")
     
     # MPS (Apple Silicon)
-    if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
+    if MPS_BACKEND_AVAILABLE and torch.backends.mps.is_available():
         print("✅ MPS (Metal Performance Shaders) disponible - GPU Apple Silicon")
         return "mps"
     else:
@@ -82,9 +94,10 @@ def test_transcription_with_gpu():
     
     # Rechercher tous les fichiers audio, y compris ceux avec des espaces
     if audio_dir.exists():
-        for file_path in audio_dir.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in ['.mp3', '.wav', '.m4a', '.flac', '.ogg']:
-                audio_files.append(file_path)
+        # scandir fournit le type de fichier depuis la lecture du dossier (pas de stat par fichier)
+        with os.scandir(audio_dir) as entries:
+            audio_files = [Path(entry.path) for entry in entries
+                           if entry.is_file() and os.path.splitext(entry.name)[1].lower() in AUDIO_EXTENSIONS]
     
     if not audio_files:
         print("❌ Aucun fichier audio trouvé dans le dossier 'audio/'")
@@ -111,105 +124,123 @@ def test_transcription_with_gpu():
         print(f"❌ Erreur d'import : {e}")
         return
     
-    # Traiter chaque fichier
+    # Initialiser le transcripteur une seule fois pour tous les fichiers
+    if diarization_available:
+        transcriber = Transcriber(
+            model_name="medium",
+            language="fr", 
+            device=optimal_device if optimal_device != "cpu" else None,
+            enable_diarization=True,
+            verbose=False
+        )
+    else:
+        transcriber = Transcriber(
+            model_name="medium",
+            language="fr",
+            device=optimal_device if optimal_device != "cpu" else None,
+            verbose=False  
+        )
+    export_manager = ExportManager()
+    
+    # Fichiers traités un par un : le modèle Whisper partagé n'est pas réentrant
+    # (ses hooks de cache clé/valeur sont posés sur le modèle à chaque décodage)
+    file_results = [
+        process_file(audio_file, transcriber, export_manager, output_dir, diarization_available)
+        for audio_file in audio_files
+    ]
+    
+    # Statistiques dans l'ordre des fichiers
     results = []
     
-    for i, audio_file in enumerate(audio_files, 1):
+    for i, (audio_file, result) in enumerate(zip(audio_files, file_results), 1):
         print(f"\n🎵 FICHIER {i}/{len(audio_files)} : {audio_file.name}")
         print("=" * 70)
         
-        try:
-            # Initialiser le transcripteur
-            if diarization_available:
-                transcriber = Transcriber(
-                    model_name="medium",
-                    language="fr", 
-                    device=optimal_device if optimal_device != "cpu" else None,
-                    enable_diarization=True,
-                    verbose=False
-                )
-            else:
-                transcriber = Transcriber(
-                    model_name="medium",
-                    language="fr",
-                    device=optimal_device if optimal_device != "cpu" else None,
-                    verbose=False  
-                )
-            
-            # Transcription
-            print("🔄 Transcription en cours...")
-            
-            if diarization_available:
-                result = transcriber.transcribe_with_speakers(
-                    str(audio_file),
-                    word_timestamps=True
-                )
-            else:
-                result = transcriber.transcribe_with_timestamps(
-                    str(audio_file), 
-                    word_timestamps=True
-                )
-            
-            # Générer un nom de fichier de sortie propre
-            output_name = audio_file.stem.lower().replace(" ", "_")
-            
-            # Export
-            export_manager = ExportManager()
-            
-            # JSON complet
-            json_file = output_dir / f"{output_name}_complete.json"
-            export_manager.export_json(result, str(json_file))
-            
-            # CSV pour analyse
-            csv_file = output_dir / f"{output_name}_data.csv"
-            export_manager.export_csv(result, str(csv_file))
-            
-            # Format artistique
-            artistic_file = output_dir / f"{output_name}_artistic.json"
-            export_manager.export_artistic_format(result, str(artistic_file))
-            
-            # Sous-titres
-            srt_file = output_dir / f"{output_name}_subtitles.srt"
-            if diarization_available:
-                export_srt_with_speakers(result, str(srt_file))
-            else:
-                export_manager.export_srt_subtitles(result, str(srt_file))
-            
-            # Statistiques
-            print_stats(result, diarization_available)
-            
-            results.append((audio_file.name, result))
-            
-        except Exception as e:
-            print(f"❌ Erreur lors du traitement de {audio_file.name} : {e}")
-            import traceback
-            traceback.print_exc()
+        if result is None:
+            continue
+        
+        # Statistiques
+        print_stats(result, diarization_available)
+        
+        results.append((audio_file.name, result))
     
     # Résumé final
     print_final_summary(results, diarization_available)
 
 
+def process_file(audio_file, transcriber, export_manager, output_dir, diarization_available):
+    """Transcrit et exporte un fichier audio (None en cas d'erreur)."""
+    try:
+        # Transcription
+        print(f"🔄 Transcription en cours : {audio_file.name}")
+        
+        if diarization_available:
+            result = transcriber.transcribe_with_speakers(
+                str(audio_file),
+                word_timestamps=True
+            )
+        else:
+            result = transcriber.transcribe_with_timestamps(
+                str(audio_file), 
+                word_timestamps=True
+            )
+        
+        # Générer un nom de fichier de sortie propre
+        output_name = audio_file.stem.lower().translate(_SANITIZE)
+        
+        # JSON complet
+        json_file = output_dir / f"{output_name}_complete.json"
+        export_manager.export_json(result, str(json_file))
+        
+        # CSV pour analyse
+        csv_file = output_dir / f"{output_name}_data.csv"
+        export_manager.export_csv(result, str(csv_file))
+        
+        # Format artistique
+        artistic_file = output_dir / f"{output_name}_artistic.json"
+        export_manager.export_artistic_format(result, str(artistic_file))
+        
+        # Sous-titres
+        srt_file = output_dir / f"{output_name}_subtitles.srt"
+        if diarization_available:
+            export_srt_with_speakers(result, str(srt_file))
+        else:
+            export_manager.export_srt_subtitles(result, str(srt_file))
+        
+        return result
+        
+    except Exception as e:
+        print(f"❌ Erreur lors du traitement de {audio_file.name} : {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+
+
 def export_srt_with_speakers(transcription_data, output_path):
     """Exporte SRT avec indication des intervenants."""
     try:
         def format_time(seconds):
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            secs = int(seconds % 60)
-            millis = int((seconds % 1) * 1000)
+            # Millisecondes entières calculées une fois, puis découpées par divmod
+            secs, millis = divmod(int(seconds * 1000), 1000)
+            minutes, secs = divmod(secs, 60)
+            hours, minutes = divmod(minutes, 60)
             return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
         
+        # Blocs SRT assemblés en mémoire puis écrits en une seule fois
+        parts = []
+        for i, segment in enumerate(transcription_data["transcription"]["segments"], 1):
+            start_time = format_time(segment["start"])
+            end_time = format_time(segment["end"])
+            speaker = segment.get("speaker", "")
+            text = segment["text"].strip()
+            
+            if speaker and speaker != "Inconnu":
+                text = f"[{speaker}] {text}"
+            
+            parts.append(f"{i}\n{start_time} --> {end_time}\n{text}\n\n")
+        
         with open(output_path, 'w', encoding='utf-8') as f:
-            for i, segment in enumerate(transcription_data["transcription"]["segments"], 1):
-                start_time = format_time(segment["start"])
-                end_time = format_time(segment["end"])
-                speaker = segment.get("speaker", "")
-                text = segment["text"].strip()
-                
-                if speaker and speaker != "Inconnu":
-                    text = f"[{speaker}] {text}"
-                
-                f.write(f"{i}\n{start_time} --> {end_time}\n{text}\n\n")
+            f.write("".join(parts))
         
         print(f"📺 Sous-titres avec intervenants : {Path(output_path).name}")
         
@@ -5,24 +5,43 @@ Explorateur de vocabulaire pour le système Mix-Play
 Permet de voir quels mots sont disponibles dans les transcriptions
 """
 
+import re
 import sys
 sys.path.append('..')
 
 from src.mix_player import MixPlayer
 import difflib
+from itertools import islice
 from pathlib import Path
+from typing import Optional
 
-def explore_vocabulary():
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# MixPlayer chargé une seule fois et partagé entre les recherches
+_mix_player: Optional[MixPlayer] = None
+
+def _get_player() -> MixPlayer:
+    """Retourne le MixPlayer partagé, en chargeant les transcriptions au premier appel"""
+    global _mix_player
+    if _mix_player is None:
+        print("🎵 Chargement des transcriptions...")
+        _mix_player = MixPlayer()
+        _mix_player.load_transcriptions()
+    return _mix_player
+
+def explore_vocabulary(mix_player: Optional[MixPlayer] = None):
     """Explore le vocabulaire disponible dans les transcriptions"""
     
     print("🔍 EXPLORATEUR DE VOCABULAIRE")
     print("=" * 40)
     
-    # Initialiser le MixPlayer
-    mix_player = MixPlayer()
-    
-    print("🎵 Chargement des transcriptions...")
-    mix_player.load_transcriptions()
+    # Réutiliser le MixPlayer fourni ou celui déjà chargé
+    if mix_player is None:
+        mix_player = _get_player()
     
     # Statistiques générales
     total_words = sum(len(matches) for matches in mix_player.word_index.values())
@@ -35,8 +54,8 @@ def explore_vocabulary():
     print("🎯 ÉCHANTILLON DU VOCABULAIRE:")
     print("-" * 30)
     
-    # Trier les mots par ordre alphabétique
-    sorted_words = sorted(mix_player.word_index.keys())
+    # Mots déjà triés par ordre alphabétique lors de l'indexation (_build_key_index)
+    sorted_words = mix_player._sorted_keys.tolist()
     
     # Afficher les premiers mots
     print("📝 Premiers mots (A-C):")
@@ -46,42 +65,45 @@ def explore_vocabulary():
         print(f"  • {example_match.word} ({word}) - {count} occurrences")
     
     print("\n🔤 Mots courts (1-3 lettres):")
-    short_words = [w for w in sorted_words if len(w) <= 3][:15]
+    # Arrêt dès les 15 premiers mots courts trouvés, sans filtrer tout le vocabulaire
+    short_words = list(islice((w for w in sorted_words if len(w) <= 3), 15))
     for word in short_words:
         example_match = mix_player.word_index[word][0]
         count = len(mix_player.word_index[word])
         print(f"  • {example_match.word} ({word}) - {count} occurrences")
     
-    print("\n💝 Mots d'amour/émotion:")
-    love_words = []
+    # Une seule passe sur le vocabulaire pour les deux catégories : une alternance regex
+    # compilée par catégorie remplace la boucle Python sur chaque mot-clé
     emotion_keywords = ['amour', 'coeur', 'aime', 'love', 'emotion', 'sentiment', 'passion', 'tendresse', 'affection']
+    music_keywords = ['music', 'son', 'melodie', 'chant', 'rythme', 'note', 'voix', 'art', 'belle', 'beaute']
+    category_patterns = {
+        'emotion': re.compile('|'.join(map(re.escape, emotion_keywords))),
+        'music': re.compile('|'.join(map(re.escape, music_keywords))),
+    }
+    category_words = {category: [] for category in category_patterns}
     
     for word in sorted_words:
-        for keyword in emotion_keywords:
-            if keyword in word.lower():
-                love_words.append(word)
-                break
+        for category, keyword_re in category_patterns.items():
+            if len(category_words[category]) < 10 and keyword_re.search(word):
+                category_words[category].append(word)
+        if all(len(words) >= 10 for words in category_words.values()):
+            break
     
-    for word in love_words[:10]:
+    print("\n💝 Mots d'amour/émotion:")
+    for word in category_words['emotion']:
         example_match = mix_player.word_index[word][0]
         count = len(mix_player.word_index[word])
         print(f"  • {example_match.word} ({word}) - {count} occurrences")
     
     print("\n🎼 Mots musicaux/artistiques:")
-    music_words = []
-    music_keywords = ['music', 'son', 'melodie', 'chant', 'rythme', 'note', 'voix', 'art', 'belle', 'beaute']
-    
-    for word in sorted_words:
-        for keyword in music_keywords:
-            if keyword in word.lower():
-                music_words.append(word)
-                break
-    
-    for word in music_words[:10]:
+    for word in category_words['music']:
         example_match = mix_player.word_index[word][0]
         count = len(mix_player.word_index[word])
         print(f"  • {example_match.word} ({word}) - {count} occurrences")
     
+    # Vocabulaire figé une fois pour toutes les recherches de suggestions
+    vocabulary = list(mix_player.word_index.keys())
+    
     # Recherche interactive
     print("\n" + "=" * 40)
     print("🔍 RECHERCHE INTERACTIVE")
@@ -108,12 +130,24 @@ def explore_vocabulary():
             print(f"❌ '{search_term}' non trouvé")
             
             # Suggestions similaires
-            similar = difflib.get_close_matches(
-                cleaned_search, 
-                mix_player.word_index.keys(), 
-                n=5, 
-                cutoff=0.6
-            )
+            if RAPIDFUZZ_AVAILABLE:
+                # Distance d'édition en C++ ; fuzz.ratio équivaut à SequenceMatcher.ratio (0-100)
+                similar = [
+                    choice for choice, _, _ in fuzz_process.extract(
+                        cleaned_search,
+                        vocabulary,
+                        scorer=fuzz.ratio,
+                        limit=5,
+                        score_cutoff=60
+                    )
+                ]
+            else:
+                similar = difflib.get_close_matches(
+                    cleaned_search, 
+                    vocabulary, 
+                    n=5, 
+                    cutoff=0.6
+                )
             
             if similar:
                 print("💡 Mots similaires disponibles:")
@@ -121,19 +155,19 @@ def explore_vocabulary():
                     example = mix_player.word_index[sim_word][0]
                     print(f"  • {example.word} ({sim_word})")
 
-def search_vocabulary_pattern(pattern: str):
+def search_vocabulary_pattern(pattern: str, mix_player: Optional[MixPlayer] = None):
     """Recherche des mots correspondant à un motif"""
     
-    mix_player = MixPlayer()
-    mix_player.load_transcriptions()
+    if mix_player is None:
+        mix_player = _get_player()
     
     print(f"🔍 Recherche de mots contenant '{pattern}':")
     print("-" * 40)
     
-    matching_words = []
-    for word_key in mix_player.word_index.keys():
-        if pattern.lower() in word_key.lower():
-            matching_words.append(word_key)
+    # Les clés de l'index sont déjà en minuscules (clean_word) : un seul lower() sur le motif
+    # et un filtre sur la liste des clés construite au chargement
+    pat = pattern.lower()
+    matching_words = [word_key for word_key in mix_player._word_keys if pat in word_key]
     
     if matching_words:
         matching_words.sort()
@@ -151,9 +185,9 @@ def search_vocabulary_pattern(pattern: str):
 
 if __name__ == "__main__":
     if len(sys.argv) > 1:
-        # Mode recherche de motif
-        pattern = sys.argv[1]
-        search_vocabulary_pattern(pattern)
+        # Mode recherche de motif (plusieurs motifs possibles, transcriptions chargées une fois)
+        for pattern in sys.argv[1:]:
+            search_vocabulary_pattern(pattern)
     else:
         # Mode exploration interactive
         explore_vocabulary()
\ No newline at end of file
@@ -3,10 +3,13 @@ Analyseur sémantique pour la catégorisation des types d'amour.
 Utilise des modèles de traitement du langage naturel et des règles lexicales.
 """
 
+import os
 import re
 import json
+import hashlib
+from pathlib import Path
 from typing import Dict, List, Any, Tuple
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 import numpy as np
 
 try:
@@ -18,8 +21,6 @@ except ImportError:
 
 try:
     from sentence_transformers import SentenceTransformer
-    import numpy as np
-    from scipy.spatial.distance import cosine
     SENTENCE_TRANSFORMERS_AVAILABLE = True
 except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
@@ -55,11 +56,27 @@ try:
 except ImportError:
     SKLEARN_AVAILABLE = False
 
+# Cache disque des embeddings des types d'amour (prototypes fixes pour un modèle donné)
+EMBEDDINGS_CACHE_DIR = Path.home() / ".cache" / "amours"
+
+# Moteur d'inférence de sentence-transformers : "torch" (défaut), "onnx" (ONNX Runtime)
+# ou "openvino" ; nécessite optimum[onnxruntime] / optimum[openvino] hors torch
+SEMANTIC_BACKEND = os.environ.get("AMOURS_BACKEND", "torch").lower()
+if SEMANTIC_BACKEND == "ort":
+    SEMANTIC_BACKEND = "onnx"
+
+# Modèle ONNX quantifié int8 (VNNI) publié avec les modèles sentence-transformers
+ONNX_INT8_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+# Nombre maximum de textes dont les scores sémantiques sont gardés en mémoire
+SEMANTIC_CACHE_SIZE = 4096
+
 
 class LoveTypeAnalyzer:
     """Analyseur des types d'amour dans les segments de texte."""
     
-    def __init__(self, min_score_threshold=0.1, use_semantic_analysis=True, reconstruct_sentences=True):
+    def __init__(self, min_score_threshold=0.1, use_semantic_analysis=True, reconstruct_sentences=True,
+                 int8=False):
         """
         Initialise l'analyseur.
         
@@ -67,12 +84,18 @@ class LoveTypeAnalyzer:
             min_score_threshold: Seuil minimum pour considérer un score d'amour significatif
             use_semantic_analysis: Utiliser l'analyse sémantique avec sentence-transformers
             reconstruct_sentences: Reconstruire les phrases complètes avant analyse
+            int8: Quantifier dynamiquement les couches linéaires de l'encodeur en int8 (CPU)
         """
         self.min_score_threshold = min_score_threshold
         self.use_semantic_analysis = use_semantic_analysis
         self.reconstruct_sentences = reconstruct_sentences
+        self.int8 = int8
         self.semantic_model = None
+        self.semantic_model_name = None
+        self.semantic_backend = "torch"
         self.love_embeddings = None
+        self.love_embedding_matrix = None  # Embeddings normalisés (types × dimension)
+        self.semantic_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()  # Cache LRU des scores par texte
         self.sentence_reconstructor = None
         
         # Initialiser le reconstructeur de phrases si demandé
@@ -235,7 +258,8 @@ class LoveTypeAnalyzer:
             for model_name in model_options:
                 try:
                     print(f"🤖 Chargement du modèle sémantique : {model_name}")
-                    self.semantic_model = SentenceTransformer(model_name)
+                    self.semantic_model = self._load_sentence_transformer(model_name)
+                    self.semantic_model_name = model_name
                     print(f"✅ Modèle chargé : {model_name}")
                     break
                 except Exception as e:
@@ -245,11 +269,56 @@ class LoveTypeAnalyzer:
             if not self.semantic_model:
                 print("❌ Aucun modèle sentence-transformers disponible")
                 self.use_semantic_analysis = False
+            elif self.int8 and self.semantic_backend == "torch":
+                self._quantize_semantic_model()
                 
         except Exception as e:
             print(f"❌ Erreur lors de l'initialisation du modèle sémantique : {str(e)}")
             self.use_semantic_analysis = False
     
+    def _load_sentence_transformer(self, model_name: str):
+        """
+        Charge un modèle avec le moteur choisi par AMOURS_BACKEND (ONNX Runtime ou
+        OpenVINO : fusion d'opérateurs, noyaux AVX-512/VNNI), repli sur torch en cas d'échec.
+        """
+        if SEMANTIC_BACKEND != "torch":
+            attempts = []
+            if SEMANTIC_BACKEND == "onnx" and self.int8:
+                attempts.append({"model_kwargs": {"file_name": ONNX_INT8_FILE}})
+            attempts.append({})
+            
+            for extra_kwargs in attempts:
+                try:
+                    model = SentenceTransformer(model_name, backend=SEMANTIC_BACKEND, **extra_kwargs)
+                    self.semantic_backend = SEMANTIC_BACKEND
+                    quantized = " int8" if extra_kwargs else ""
+                    print(f"⚡ Moteur d'inférence : {SEMANTIC_BACKEND}{quantized}")
+                    return model
+                except Exception as e:
+                    print(f"⚠️  Moteur {SEMANTIC_BACKEND} indisponible ({str(e)})")
+            print("   ↪️  Repli sur torch")
+        
+        self.semantic_backend = "torch"
+        return SentenceTransformer(model_name)
+    
+    def _quantize_semantic_model(self):
+        """
+        Quantification dynamique int8 des nn.Linear du transformeur : poids 4x plus
+        légers et produits scalaires int8 sur CPU, pour un encodage plus rapide.
+        """
+        if not TRANSFORMERS_AVAILABLE:
+            print("⚠️  torch non disponible - quantification int8 désactivée")
+            return
+        
+        try:
+            transformer = self.semantic_model._first_module()
+            transformer.auto_model = torch.quantization.quantize_dynamic(
+                transformer.auto_model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            print("✅ Modèle sémantique quantifié en int8")
+        except Exception as e:
+            print(f"⚠️  Échec de la quantification int8 : {str(e)}")
+    
     def _create_love_embeddings(self):
         """Crée les embeddings des descriptions des types d'amour."""
         if not self.semantic_model:
@@ -265,21 +334,42 @@ class LoveTypeAnalyzer:
                 full_description = f"{description}. Mots-clés : {key_keywords}"
                 love_descriptions[love_type] = full_description
             
-            # Générer les embeddings
+            # Générer les embeddings (relus depuis le disque s'ils ont déjà été calculés)
             descriptions_list = list(love_descriptions.values())
-            embeddings = self.semantic_model.encode(descriptions_list)
+            cache_path = self._love_embeddings_cache_path(descriptions_list)
+            try:
+                embeddings = np.load(cache_path, mmap_mode='r')
+            except (OSError, ValueError):
+                embeddings = self.semantic_model.encode(descriptions_list)
+                try:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    np.save(cache_path, embeddings)
+                except OSError as e:
+                    print(f"⚠️  Impossible d'écrire le cache des embeddings : {e}")
             
             # Stocker avec les noms des types
             self.love_embeddings = {}
             for i, love_type in enumerate(love_descriptions.keys()):
                 self.love_embeddings[love_type] = embeddings[i]
             
+            # Matrice normalisée : similarité cosinus d'un lot = un seul produit matriciel
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            self.love_embedding_matrix = embeddings / np.maximum(norms, 1e-12)
+            
             print(f"✅ Embeddings créés pour {len(self.love_embeddings)} types d'amour")
             
         except Exception as e:
             print(f"❌ Erreur lors de la création des embeddings : {str(e)}")
             self.love_embeddings = None
     
+    def _love_embeddings_cache_path(self, descriptions: List[str]) -> Path:
+        """Chemin du cache des embeddings, signé par le modèle, le moteur, la quantification et les descriptions."""
+        key = hashlib.sha1(
+            (f"{self.semantic_model_name}||{self.semantic_backend}||int8={self.int8}||"
+             + json.dumps(descriptions, sort_keys=True)).encode()
+        ).hexdigest()
+        return EMBEDDINGS_CACHE_DIR / f"proto_{key}.npy"
+    
     def _init_analyzers(self):
         """Initialise les outils d'analyse."""
         if TRANSFORMERS_AVAILABLE:
@@ -321,53 +411,110 @@ class LoveTypeAnalyzer:
         Returns:
             Dictionnaire avec les scores pour chaque type d'amour (0-1)
         """
-        text_lower = text.lower()
-        scores = {}
+        return self.analyze_segments_batch([text])[0]
+    
+    def analyze_segments_batch(self, texts: List[str], batch_size: int = 16,
+                               sort_by_length: bool = True) -> List[Dict[str, float]]:
+        """
+        Analyse plusieurs segments de texte en un seul passage du modèle sémantique.
         
-        for love_type, category_data in self.love_categories.items():
-            # Score traditionnel (mots-clés + regex)
-            traditional_score = self._calculate_love_score(text_lower, category_data)
+        Args:
+            texts: Textes à analyser
+            batch_size: Taille des lots envoyés à l'encodeur
+            sort_by_length: Regrouper les textes de longueur proche dans les mêmes lots
             
-            # Score sémantique si disponible
-            semantic_score = 0.0
-            if self.use_semantic_analysis and self.semantic_model and self.love_embeddings:
-                semantic_score = self._calculate_semantic_score(text, love_type)
+        Returns:
+            Liste des dictionnaires de scores (0-1), dans l'ordre des textes
+        """
+        semantic_scores = self._calculate_semantic_scores(texts, batch_size, sort_by_length)
+        
+        results = []
+        for i, text in enumerate(texts):
+            text_lower = text.lower()
+            scores = {}
             
-            # Combiner les scores (pondération adaptative)
-            if semantic_score > 0:
-                # Si on a l'analyse sémantique, donner plus de poids
-                final_score = (traditional_score * 0.4) + (semantic_score * 0.6)
-            else:
-                # Sinon, utiliser seulement l'analyse traditionnelle
-                final_score = traditional_score
+            for j, (love_type, category_data) in enumerate(self.love_categories.items()):
+                # Score traditionnel (mots-clés + regex)
+                traditional_score = self._calculate_love_score(text_lower, category_data)
+                
+                # Score sémantique si disponible
+                semantic_score = float(semantic_scores[i, j]) if semantic_scores is not None else 0.0
+                
+                # Combiner les scores (pondération adaptative)
+                if semantic_score > 0:
+                    # Si on a l'analyse sémantique, donner plus de poids
+                    final_score = (traditional_score * 0.4) + (semantic_score * 0.6)
+                else:
+                    # Sinon, utiliser seulement l'analyse traditionnelle
+                    final_score = traditional_score
+                
+                # S’assurer que c'est un float Python standard
+                scores[love_type] = float(round(final_score, 3))
             
-            # S’assurer que c'est un float Python standard
-            scores[love_type] = float(round(final_score, 3))
+            results.append(scores)
         
-        return scores
+        return results
     
-    def _calculate_semantic_score(self, text: str, love_type: str) -> float:
-        """Calcule le score sémantique pour un type d'amour donné."""
+    def _calculate_semantic_scores(self, texts: List[str], batch_size: int = 16,
+                                   sort_by_length: bool = True):
+        """
+        Calcule les scores sémantiques (textes × types d'amour) avec un seul encodage
+        des textes et un produit matriciel contre les embeddings des types.
+        
+        Les scores sont gardés en cache (LRU) par texte normalisé : seuls les textes
+        jamais vus passent par l'encodeur. Avec sort_by_length, ceux-ci sont encodés
+        par longueur croissante : chaque lot contient des phrases de taille proche
+        (peu de tokens de padding).
+        
+        Returns:
+            Matrice des scores, ou None si l'analyse sémantique est indisponible
+        """
+        if not (self.use_semantic_analysis and self.semantic_model and self.love_embeddings) or not texts:
+            return None
+        
+        keys = [text.strip().lower() for text in texts]
+        originals = {}
+        for key, text in zip(keys, texts):
+            originals.setdefault(key, text)
+        missing = [key for key in originals if key not in self.semantic_cache]
+        
         try:
-            if not self.semantic_model or not self.love_embeddings or love_type not in self.love_embeddings:
-                return 0.0
-            
-            # Générer l'embedding du texte
-            text_embedding = self.semantic_model.encode([text])
-            love_embedding = self.love_embeddings[love_type]
-            
-            # Calculer la similarité cosinus
-            similarity = 1 - cosine(text_embedding[0], love_embedding)
-            
-            # Normaliser et ajuster le score (convertir en float Python)
-            # Les embeddings peuvent donner des scores assez bas, donc on les amplifie
-            semantic_score = float(max(0.0, min(1.0, similarity * 1.5)))
-            
-            return semantic_score
+            computed = {}
+            if missing:
+                if sort_by_length:
+                    missing.sort(key=len)
+                
+                # Embeddings normalisés : le produit scalaire est la similarité cosinus
+                text_embeddings = self.semantic_model.encode(
+                    [originals[key] for key in missing],
+                    batch_size=batch_size,
+                    show_progress_bar=False,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True
+                )
+                similarities = np.matmul(text_embeddings, self.love_embedding_matrix.T)
+                
+                # Les embeddings peuvent donner des scores assez bas, donc on les amplifie
+                computed = dict(zip(missing, np.clip(similarities * 1.5, 0.0, 1.0)))
             
         except Exception as e:
-            print(f"⚠️  Erreur calcul sémantique pour {love_type}: {str(e)}")
-            return 0.0
+            print(f"⚠️  Erreur calcul sémantique : {str(e)}")
+            return None
+        
+        rows = []
+        for key in keys:
+            if key in computed:
+                rows.append(computed[key])
+            else:
+                self.semantic_cache.move_to_end(key)
+                rows.append(self.semantic_cache[key])
+        
+        for key, row in computed.items():
+            self.semantic_cache[key] = row
+            if len(self.semantic_cache) > SEMANTIC_CACHE_SIZE:
+                self.semantic_cache.popitem(last=False)
+        
+        return np.stack(rows)
     
     def _calculate_love_score(self, text: str, category_data: Dict) -> float:
         """Calcule le score d'un type d'amour spécifique."""
@@ -443,11 +590,10 @@ class LoveTypeAnalyzer:
         global_stats = defaultdict(list)
         total_segments_with_love = 0
         
-        for i, segment in enumerate(segments):
-            text = segment["text"]
-            
-            # Analyser le segment
-            love_scores = self.analyze_segment(text)
+        # Analyser tous les segments en un seul lot
+        all_love_scores = self.analyze_segments_batch([segment["text"] for segment in segments])
+        
+        for segment, love_scores in zip(segments, all_love_scores):
             
             # Ajouter les scores au segment
             segment["love_analysis"] = love_scores
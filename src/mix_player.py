@@ -8,16 +8,337 @@ Ce module permet de :
 - Générer un fichier audio final mixé avec les différentes voix
 """
 
+import hashlib
+import importlib.util
 import json
+import math
 import os
+import pickle
 import re
+import subprocess
+import threading
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import unicodedata
 from pydub import AudioSegment
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import difflib
+import numpy as np
+
+# Étirement temporel adapté à la parole (optionnel, nécessite le binaire rubberband)
+try:
+    import pyrubberband
+    PYRUBBERBAND_AVAILABLE = True
+except ImportError:
+    PYRUBBERBAND_AVAILABLE = False
+
+# Étirement temporel par lots sur GPU (optionnel) : seule la présence est vérifiée ici,
+# torch/torchaudio ne sont importés qu'au premier usage (import coûteux pour tous les scripts)
+TORCHAUDIO_AVAILABLE = importlib.util.find_spec("torchaudio") is not None
+
+# Lecture directe des rendus en mémoire (optionnel)
+try:
+    import sounddevice
+    SOUNDDEVICE_AVAILABLE = True
+except ImportError:
+    SOUNDDEVICE_AVAILABLE = False
+
+# Compilation JIT des crossfades (optionnel)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Moteurs de changement de tempo disponibles
+TEMPO_BACKENDS = ("rubberband", "ffmpeg", "librosa", "torchaudio")
+
+# Paramètres STFT du vocodeur de phase (valeurs par défaut de librosa.effects.time_stretch)
+STFT_N_FFT = 2048
+STFT_HOP_LENGTH = 512
+
+# Nombre maximum d'extraits de mots décodés gardés en mémoire
+WORD_CACHE_SIZE = 256
+
+# Nombre maximum de STFT de mots gardées en mémoire (moteur librosa, reuse_stft)
+STFT_CACHE_SIZE = WORD_CACHE_SIZE
+
+# Nombre maximum de phrases composées gardées en mémoire
+COMPOSE_CACHE_SIZE = 256
+
+# Cache disque de l'index des mots (évite de reparser les JSON à chaque lancement)
+TRANSCRIPTIONS_CACHE_DIR = Path.home() / ".cache" / "amours"
+
+# Cache disque des extraits de mots décodés, partagé entre les scripts et les lancements
+WORD_DISK_CACHE_DIR = TRANSCRIPTIONS_CACHE_DIR / "words"
+
+# Taille maximale du cache disque des extraits (les plus anciens sont supprimés au-delà)
+WORD_DISK_CACHE_BYTES = 2 * 1024 ** 3
+
+# Taille courante du cache disque des extraits (mesurée au premier ajout du processus)
+_word_disk_cache_size: Optional[int] = None
+_word_disk_cache_lock = threading.Lock()
+
+# Paramètres STFT de l'étirement par lots torchaudio
+GPU_STFT_N_FFT = 512
+GPU_STFT_HOP_LENGTH = 128
+
+
+@lru_cache(maxsize=256)
+def _probe_audio_format(audio_path: str, mtime_ns: int) -> Tuple[int, int]:
+    """
+    Fréquence d'échantillonnage et nombre de canaux natifs d'un fichier (ffprobe),
+    interrogés une seule fois par fichier et par version (date de modification).
+    """
+    cmd = [
+        "ffprobe", "-v", "error",
+        "-select_streams", "a:0",
+        "-show_entries", "stream=sample_rate,channels",
+        "-of", "csv=p=0",
+        str(audio_path),
+    ]
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True, text=True)
+    sample_rate, channels = result.stdout.strip().splitlines()[0].split(",")[:2]
+    return int(sample_rate), int(channels)
+
+
+def _word_disk_cache_path(audio_path: str, start_ms: int, end_ms: int,
+                          stat: os.stat_result, frame_rate: int, channels: int) -> Path:
+    """
+    Chemin du cache disque d'un extrait, signé par le fichier source (chemin, taille,
+    date de modification), la fenêtre en ms et le format PCM de décodage.
+    """
+    signature = hashlib.blake2b(
+        f"{Path(audio_path).resolve()}:{stat.st_size}:{stat.st_mtime_ns}:"
+        f"{start_ms}:{end_ms}:{frame_rate}:{channels}".encode()
+    )
+    return WORD_DISK_CACHE_DIR / f"{signature.hexdigest()[:24]}.npy"
+
+
+def _evict_word_disk_cache() -> int:
+    """Supprime les extraits les plus anciens jusqu'à repasser sous WORD_DISK_CACHE_BYTES."""
+    entries = []
+    with os.scandir(WORD_DISK_CACHE_DIR) as it:
+        for entry in it:
+            if entry.name.endswith(".npy") and not entry.name.endswith(".tmp.npy"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue  # Supprimé entre-temps par un autre processus
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= WORD_DISK_CACHE_BYTES:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+    
+    return total
+
+
+def _add_to_word_disk_cache(n_bytes: int) -> None:
+    """Comptabilise un extrait écrit et déclenche l'éviction si le plafond est dépassé."""
+    global _word_disk_cache_size
+    with _word_disk_cache_lock:
+        if _word_disk_cache_size is None:
+            _word_disk_cache_size = _evict_word_disk_cache()
+        else:
+            _word_disk_cache_size += n_bytes
+            if _word_disk_cache_size > WORD_DISK_CACHE_BYTES:
+                _word_disk_cache_size = _evict_word_disk_cache()
+
+
+def _decode_word_window(audio_path: str, start_ms: int, end_ms: int,
+                        use_disk_cache: bool = True) -> AudioSegment:
+    """
+    Décode uniquement la fenêtre [start_ms, end_ms] d'un fichier audio via ffmpeg,
+    en relisant le PCM depuis le cache disque s'il a déjà été décodé (si use_disk_cache).
+    
+    L'extrait garde la fréquence et les canaux du fichier source (comme AudioSegment.from_file).
+    """
+    stat = os.stat(audio_path)
+    frame_rate, channels = _probe_audio_format(str(audio_path), stat.st_mtime_ns)
+    cache_path = _word_disk_cache_path(audio_path, start_ms, end_ms, stat, frame_rate, channels)
+    if use_disk_cache:
+        try:
+            samples = np.load(cache_path)
+            return AudioSegment(
+                data=samples.tobytes(),
+                sample_width=2,
+                frame_rate=frame_rate,
+                channels=channels
+            )
+        except (OSError, ValueError):
+            pass  # Absent ou illisible : on décode
+    
+    cmd = [
+        "ffmpeg", "-v", "error",
+        "-ss", f"{start_ms / 1000:.3f}",
+        "-t", f"{(end_ms - start_ms) / 1000:.3f}",
+        "-i", str(audio_path),
+        "-f", "s16le",
+        "-ac", str(channels),
+        "-ar", str(frame_rate),
+        "pipe:1",
+    ]
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+    
+    if use_disk_cache:
+        try:
+            # Écriture atomique : plusieurs processus de test peuvent décoder le même mot
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.{threading.get_ident()}.tmp.npy")
+            np.save(tmp_path, np.frombuffer(result.stdout, dtype=np.int16))
+            os.replace(tmp_path, cache_path)
+            _add_to_word_disk_cache(cache_path.stat().st_size)
+        except OSError as e:
+            print(f"⚠️ Impossible d'écrire le cache de l'extrait: {e}")
+    
+    return AudioSegment(
+        data=result.stdout,
+        sample_width=2,
+        frame_rate=frame_rate,
+        channels=channels
+    )
+
+
+def _is_unit_tempo(tempo_factor: float) -> bool:
+    """Vrai si le facteur de tempo ne change rien (à l'arrondi flottant près)."""
+    return math.isclose(tempo_factor, 1.0, abs_tol=1e-6)
+
+
+@lru_cache(maxsize=16)
+def _get_resampler(orig_freq: int, new_freq: int):
+    """Rééchantillonneur torchaudio (noyau sinc précalculé), partagé entre les mots de même fréquence."""
+    import torchaudio
+    return torchaudio.transforms.Resample(orig_freq, new_freq, resampling_method="sinc_interp_hann")
+
+
+def _resample_segment(segment: AudioSegment, frame_rate: int) -> AudioSegment:
+    """
+    Ramène un segment à la fréquence voulue : aucun calcul si elle est déjà bonne,
+    torchaudio si disponible, sinon la conversion pydub (audioop).
+    """
+    if segment.frame_rate == frame_rate:
+        return segment
+    if not TORCHAUDIO_AVAILABLE:
+        return segment.set_frame_rate(frame_rate)
+    
+    import torch
+    
+    segment = segment.set_sample_width(2)
+    samples = np.frombuffer(segment.raw_data, dtype=np.int16).reshape(-1, segment.channels)
+    waveform = torch.from_numpy(samples.T.astype(np.float32) / 32768.0)
+    with torch.no_grad():
+        resampled = _get_resampler(segment.frame_rate, frame_rate)(waveform).numpy().T
+    resampled = np.clip(np.round(resampled * 32768.0), -32768, 32767).astype(np.int16)
+    
+    return AudioSegment(
+        data=np.ascontiguousarray(resampled).tobytes(),
+        sample_width=2,
+        frame_rate=frame_rate,
+        channels=segment.channels
+    )
+
+
+@lru_cache(maxsize=64)
+def _crossfade_ramps(n_frames: int, equal_power: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """Rampes de fondu (montante, descendante) en float32, calculées une fois par longueur."""
+    ramp_up = np.linspace(0.0, 1.0, n_frames, dtype=np.float32)[:, None]
+    ramp_down = ramp_up[::-1]
+    if equal_power:
+        # Fondu à puissance constante : pas de creux de volume au milieu du chevauchement
+        ramp_up, ramp_down = np.sqrt(ramp_up), np.sqrt(ramp_down)
+    return ramp_up, ramp_down
+
+
+def _mix_crossfade(tail: np.ndarray, head: np.ndarray, ramp_up: np.ndarray, ramp_down: np.ndarray) -> np.ndarray:
+    """Mélange la fin d'un extrait (fondu sortant) et le début du suivant (fondu entrant)."""
+    mixed = tail.astype(np.float32)
+    np.multiply(mixed, ramp_down, out=mixed)
+    faded_in = head.astype(np.float32)
+    np.multiply(faded_in, ramp_up, out=faded_in)
+    np.add(mixed, faded_in, out=mixed)
+    np.clip(mixed, -32768, 32767, out=mixed)
+    return mixed.astype(np.int16)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _mix_crossfade_jit(tail, head, equal_power):
+        """Boucle compilée équivalente à _mix_crossfade, rampes calculées à la volée."""
+        n_frames, channels = tail.shape
+        step = 1.0 / (n_frames - 1) if n_frames > 1 else 0.0
+        mixed = np.empty((n_frames, channels), dtype=np.int16)
+        for i in range(n_frames):
+            ramp_up = np.float32(i * step)
+            ramp_down = np.float32((n_frames - 1 - i) * step)
+            if equal_power:
+                ramp_up = np.sqrt(ramp_up)
+                ramp_down = np.sqrt(ramp_down)
+            for c in range(channels):
+                value = np.float32(tail[i, c]) * ramp_down + np.float32(head[i, c]) * ramp_up
+                mixed[i, c] = np.int16(min(max(value, -32768.0), 32767.0))
+        return mixed
+
+    # Compilation (ou chargement depuis le cache disque) dès l'import, hors du premier rendu
+    _warmup = np.zeros((2, 1), dtype=np.int16)
+    _mix_crossfade_jit(_warmup, _warmup, False)
+    _mix_crossfade_jit(_warmup, _warmup, True)
+    del _warmup
+
+
+def _linear_crossfade(tail: np.ndarray, head: np.ndarray) -> np.ndarray:
+    """Crossfade linéaire en amplitude."""
+    if NUMBA_AVAILABLE:
+        return _mix_crossfade_jit(tail, head, False)
+    return _mix_crossfade(tail, head, *_crossfade_ramps(len(tail), False))
+
+
+def _equal_power_crossfade(tail: np.ndarray, head: np.ndarray) -> np.ndarray:
+    """Crossfade à puissance constante."""
+    if NUMBA_AVAILABLE:
+        return _mix_crossfade_jit(tail, head, True)
+    return _mix_crossfade(tail, head, *_crossfade_ramps(len(tail), True))
+
+
+def _fade_in_out(segment: AudioSegment, fade_ms: int) -> AudioSegment:
+    """
+    Fondu d'entrée et de sortie sur les échantillons int16 : seules les zones de fondu
+    passent en float32 (au lieu des boucles pydub milliseconde par milliseconde).
+    """
+    segment = segment.set_sample_width(2)
+    samples = np.frombuffer(segment.raw_data, dtype=np.int16).reshape(-1, segment.channels).copy()
+    
+    n_frames = min(fade_ms * segment.frame_rate // 1000, len(samples) // 2)
+    if n_frames > 0:
+        ramp_up, ramp_down = _crossfade_ramps(n_frames, False)
+        for region, ramp in ((samples[:n_frames], ramp_up), (samples[-n_frames:], ramp_down)):
+            faded = region.astype(np.float32)
+            np.multiply(faded, ramp, out=faded)
+            region[:] = faded.astype(np.int16)
+    
+    return AudioSegment(
+        data=samples.tobytes(),
+        sample_width=2,
+        frame_rate=segment.frame_rate,
+        channels=segment.channels
+    )
+
+
+# Fonction de crossfade associée à chaque mode de fondu
+FADE_FUNCS = {
+    "standard": _linear_crossfade,
+    "seamless": _linear_crossfade,
+    "artistic": _equal_power_crossfade,
+}
 
 
 @dataclass
@@ -54,19 +375,37 @@ class MixPlayer:
     et de composer de nouvelles phrases à partir des extraits audio.
     """
     
-    def __init__(self, transcription_dir: str = "output_transcription", audio_dir: str = "audio"):
+    def __init__(self, transcription_dir: str = "output_transcription", audio_dir: str = "audio",
+                 use_disk_cache: bool = True):
         """
         Initialise le MixPlayer.
         
         Args:
             transcription_dir: Répertoire contenant les fichiers de transcription JSON
             audio_dir: Répertoire contenant les fichiers audio originaux
+            use_disk_cache: Utiliser les caches disque de TRANSCRIPTIONS_CACHE_DIR
+                (index des mots sérialisé, extraits de mots décodés)
         """
         self.transcription_dir = Path(transcription_dir)
         self.audio_dir = Path(audio_dir)
+        self.use_disk_cache = use_disk_cache
         self.word_index: Dict[str, List[WordMatch]] = defaultdict(list)
         self.transcriptions_loaded = False
         self.audio_cache: Dict[str, AudioSegment] = {}
+        self.word_audio_cache: "OrderedDict[Tuple[str, int, int], AudioSegment]" = OrderedDict()  # Cache LRU d'extraits
+        # Mots de l'index triés (et triés à l'envers) pour les recherches par préfixe/suffixe
+        self._word_keys: List[str] = []
+        self._sorted_keys = np.empty(0, dtype=str)
+        self._sorted_key_ids = np.empty(0, dtype=np.int64)
+        self._sorted_reversed_keys = np.empty(0, dtype=str)
+        self._sorted_reversed_key_ids = np.empty(0, dtype=np.int64)
+        # Signature des transcriptions chargées et compositions déjà calculées pour cette signature
+        self._index_signature: Optional[str] = None
+        self._compose_cache: "OrderedDict[Tuple, ComposedSentence]" = OrderedDict()
+        # Dernier rendu généré (échantillons int16 trames x canaux, fréquence) pour la lecture sans décodage
+        self.last_rendered_pcm: Optional[Tuple[np.ndarray, int]] = None
+        self._word_stft_cache: "OrderedDict[Tuple, np.ndarray]" = OrderedDict()  # STFT par mot (LRU), partagées entre variantes de tempo
+        self._tempo_device: Optional[str] = None  # Dispositif GPU pour le tempo (détecté à la demande)
     
     def clean_word(self, word: str) -> str:
         """
@@ -90,23 +429,58 @@ class MixPlayer:
         
         return word
     
-    def load_transcriptions(self) -> None:
+    def load_transcriptions(self, use_cache: Optional[bool] = None) -> None:
         """
         Charge toutes les transcriptions et indexe les mots.
+        
+        Args:
+            use_cache: Réutiliser l'index sérialisé sur disque si les transcriptions n'ont pas changé
+                (None : selon use_disk_cache du constructeur)
         """
+        if use_cache is None:
+            use_cache = self.use_disk_cache
+        
         print("🎵 Chargement des transcriptions...")
         
         # Réinitialiser l'index
         self.word_index.clear()
         
         # Parcourir tous les fichiers JSON de transcription
-        json_files = list(self.transcription_dir.glob("*_complete.json"))
+        json_files = sorted(self.transcription_dir.glob("*_complete.json"))
         
         if not json_files:
             raise FileNotFoundError(f"Aucun fichier de transcription trouvé dans {self.transcription_dir}")
         
-        for json_file in json_files:
-            self._load_single_transcription(json_file)
+        cache_path = self._transcriptions_cache_path(json_files)
+        self._index_signature = cache_path.stem
+        loaded_from_cache = False
+        if use_cache and cache_path.exists():
+            try:
+                with open(cache_path, 'rb') as f:
+                    self.word_index.update(pickle.load(f))
+                loaded_from_cache = True
+                print(f"⚡ Index chargé depuis le cache: {cache_path.name}")
+            except Exception as e:
+                print(f"⚠️  Cache illisible ({e}), relecture des transcriptions")
+                self.word_index.clear()
+        
+        if not loaded_from_cache:
+            for json_file in json_files:
+                self._load_single_transcription(json_file)
+            
+            if use_cache:
+                try:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    # Écriture atomique : un autre script lancé en parallèle ne lit jamais un pickle partiel
+                    tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.tmp")
+                    with open(tmp_path, 'wb') as f:
+                        pickle.dump(dict(self.word_index), f, protocol=pickle.HIGHEST_PROTOCOL)
+                    os.replace(tmp_path, cache_path)
+                    self._remove_stale_transcriptions_caches(cache_path)
+                except OSError as e:
+                    print(f"⚠️  Impossible d'écrire le cache {cache_path}: {e}")
+        
+        self._build_key_index()
         
         total_words = sum(len(matches) for matches in self.word_index.values())
         unique_words = len(self.word_index)
@@ -116,6 +490,61 @@ class MixPlayer:
         
         self.transcriptions_loaded = True
     
+    def _build_key_index(self) -> None:
+        """Trie les mots de l'index (endroit et envers) pour les recherches par préfixe/suffixe."""
+        self._word_keys = list(self.word_index.keys())
+        keys = np.array(self._word_keys, dtype=str)
+        reversed_keys = np.array([key[::-1] for key in self._word_keys], dtype=str)
+        
+        self._sorted_key_ids = np.argsort(keys, kind="stable")
+        self._sorted_keys = keys[self._sorted_key_ids]
+        self._sorted_reversed_key_ids = np.argsort(reversed_keys, kind="stable")
+        self._sorted_reversed_keys = reversed_keys[self._sorted_reversed_key_ids]
+    
+    @staticmethod
+    def _prefix_range(sorted_keys: np.ndarray, sorted_ids: np.ndarray, prefix: str) -> np.ndarray:
+        """Identifiants des mots commençant par prefix (recherche dichotomique)."""
+        lo = np.searchsorted(sorted_keys, prefix, side="left")
+        hi = np.searchsorted(sorted_keys, prefix + chr(0x10FFFF), side="left")
+        return sorted_ids[lo:hi]
+    
+    def _transcriptions_cache_path(self, json_files: List[Path]) -> Path:
+        """
+        Chemin du cache de l'index, signé par le répertoire, le nom, la taille et la date
+        de modification de chaque transcription.
+        
+        Args:
+            json_files: Fichiers de transcription triés
+            
+        Returns:
+            Le chemin du fichier pickle correspondant
+        """
+        signature = hashlib.blake2b(str(self.transcription_dir.resolve()).encode())
+        for json_file in json_files:
+            stat = json_file.stat()
+            signature.update(f"{json_file.name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        
+        return TRANSCRIPTIONS_CACHE_DIR / f"transcripts_{self._transcriptions_dir_key()}_{signature.hexdigest()[:16]}.pkl"
+    
+    def _transcriptions_dir_key(self) -> str:
+        """Préfixe des caches d'index propre au répertoire de transcriptions."""
+        return hashlib.blake2b(str(self.transcription_dir.resolve()).encode()).hexdigest()[:8]
+    
+    def _remove_stale_transcriptions_caches(self, current_path: Path) -> None:
+        """
+        Supprime les index sérialisés périmés du même répertoire de transcriptions
+        (et ceux de l'ancien format sans préfixe de répertoire).
+        """
+        dir_key = self._transcriptions_dir_key()
+        for path in TRANSCRIPTIONS_CACHE_DIR.glob("transcripts_*.pkl"):
+            parts = path.stem.split("_")
+            is_stale = (len(parts) == 3 and parts[1] == dir_key) or len(parts) == 2
+            if is_stale and path != current_path:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass  # Déjà supprimé par un autre processus
+    
     def _load_single_transcription(self, json_path: Path) -> None:
         """
         Charge une transcription unique et indexe ses mots.
@@ -192,13 +621,22 @@ class MixPlayer:
         prefix_matches = []
         suffix_matches = []
         
-        for word_key in self.word_index.keys():
-            # Correspondances par préfixe (pour conjugaisons)
-            if len(cleaned_search) >= 3 and word_key.startswith(cleaned_search):
-                prefix_matches.extend(self.word_index[word_key])
-            # Correspondances par suffixe (pour les mots composés)
-            elif len(cleaned_search) >= 3 and word_key.endswith(cleaned_search):
-                suffix_matches.extend(self.word_index[word_key])
+        if len(cleaned_search) >= 3:
+            if len(self._word_keys) != len(self.word_index):
+                self._build_key_index()
+            
+            # Recherche dichotomique dans les mots triés (endroit pour le préfixe, envers pour le suffixe),
+            # puis remise dans l'ordre de l'index
+            prefix_ids = np.sort(self._prefix_range(self._sorted_keys, self._sorted_key_ids, cleaned_search))
+            suffix_ids = np.sort(self._prefix_range(self._sorted_reversed_keys, self._sorted_reversed_key_ids,
+                                                    cleaned_search[::-1]))
+            # Un mot qui a déjà le préfixe n'est pas compté une seconde fois comme suffixe
+            suffix_ids = suffix_ids[~np.isin(suffix_ids, prefix_ids)]
+            
+            for key_id in prefix_ids.tolist():
+                prefix_matches.extend(self.word_index[self._word_keys[key_id]])
+            for key_id in suffix_ids.tolist():
+                suffix_matches.extend(self.word_index[self._word_keys[key_id]])
         
         # Combiner préfixe et suffixe, trier par confiance
         morphological_matches = prefix_matches + suffix_matches
@@ -323,6 +761,20 @@ class MixPlayer:
         if not self.transcriptions_loaded:
             self.load_transcriptions()
         
+        # Composition déterministe : réutiliser le résultat pour les mêmes paramètres et transcriptions
+        cache_key = (
+            tuple(words),
+            tuple(preferred_speakers) if preferred_speakers else None,
+            min_confidence,
+            max_gap_duration,
+            prioritize_diversity,
+            self._index_signature
+        )
+        if cache_key in self._compose_cache:
+            self._compose_cache.move_to_end(cache_key)
+            print(f"♻️  Composition déjà calculée: {' '.join(words)}")
+            return self._compose_cache[cache_key]
+        
         selected_words = []
         missing_words = []
         used_sources = {}  # Tracker des sources utilisées: {"file_speaker": count}
@@ -381,13 +833,19 @@ class MixPlayer:
         # Créer le texte composé
         composed_text = " ".join(word.word.strip() for word in selected_words)
         
-        return ComposedSentence(
+        composed = ComposedSentence(
             text=composed_text,
             words=selected_words,
             total_duration=total_duration,
             speakers_used=speakers_used,
             files_used=files_used
         )
+        
+        self._compose_cache[cache_key] = composed
+        if len(self._compose_cache) > COMPOSE_CACHE_SIZE:
+            self._compose_cache.popitem(last=False)
+        
+        return composed
     
     def _load_audio_file(self, audio_path: str) -> AudioSegment:
         """
@@ -405,6 +863,60 @@ class MixPlayer:
         
         return self.audio_cache[audio_path]
     
+    def _load_word_window(self, audio_path: str, start_ms: int, end_ms: int) -> AudioSegment:
+        """
+        Charge uniquement la fenêtre [start_ms, end_ms] d'un fichier audio (cache LRU borné).
+        
+        ffmpeg cherche la position avant de décoder (-ss avant -i) : le coût est
+        proportionnel à la durée du mot, pas à celle du fichier source.
+        
+        Args:
+            audio_path: Chemin vers le fichier audio
+            start_ms: Début de la fenêtre (ms)
+            end_ms: Fin de la fenêtre (ms)
+            
+        Returns:
+            L'extrait (fréquence et canaux du fichier source, 16 bits)
+        """
+        key = (audio_path, start_ms, end_ms)
+        if key in self.word_audio_cache:
+            self.word_audio_cache.move_to_end(key)
+            return self.word_audio_cache[key]
+        
+        segment = _decode_word_window(audio_path, start_ms, end_ms, self.use_disk_cache)
+        self._cache_word_window(key, segment)
+        
+        return segment
+    
+    def _cache_word_window(self, key: Tuple[str, int, int], segment: AudioSegment) -> None:
+        """Ajoute un extrait au cache LRU en évinçant le plus ancien si nécessaire."""
+        self.word_audio_cache[key] = segment
+        self.word_audio_cache.move_to_end(key)
+        if len(self.word_audio_cache) > WORD_CACHE_SIZE:
+            self.word_audio_cache.popitem(last=False)
+    
+    def _prefetch_word_windows(self, words: List[WordMatch], padding: float) -> None:
+        """Décode en parallèle les fenêtres des mots absentes du cache (ffmpeg libère le GIL)."""
+        missing = list(dict.fromkeys(
+            window for window in (self._word_window(word, padding) for word in words)
+            if window not in self.word_audio_cache
+        ))
+        if len(missing) < 2:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(len(missing), os.cpu_count() or 1)) as executor:
+            segments = list(executor.map(lambda window: _decode_word_window(*window, self.use_disk_cache), missing))
+        
+        for window, segment in zip(missing, segments):
+            self._cache_word_window(window, segment)
+    
+    def _word_window(self, word: WordMatch, padding: float) -> Tuple[str, int, int]:
+        """Fenêtre (fichier, début ms, fin ms) d'un mot avec son padding."""
+        padding_ms = int(padding * 1000)
+        start_ms = max(0, int(word.start * 1000) - padding_ms)
+        end_ms = int(word.end * 1000) + padding_ms
+        return word.audio_path, start_ms, end_ms
+    
     def generate_mixed_audio(self, composed_sentence: ComposedSentence,
                            output_path: str,
                            gap_duration: float = 0.3,
@@ -413,7 +925,10 @@ class MixPlayer:
                            normalize_volume: bool = True,
                            fade_mode: str = "standard",
                            tempo_factor: float = 1.0,
-                           preserve_pitch: bool = True) -> str:
+                           preserve_pitch: bool = True,
+                           tempo_backend: str = "rubberband",
+                           reuse_stft: bool = False,
+                           mp3_quality: Optional[int] = None) -> str:
         """
         Génère un fichier audio mixé à partir d'une phrase composée.
         
@@ -427,12 +942,20 @@ class MixPlayer:
             fade_mode: Mode de fondu ("standard", "artistic", "seamless")
             tempo_factor: Facteur de vitesse (0.5 = plus lent, 2.0 = plus rapide)
             preserve_pitch: Préserver le pitch lors du changement de tempo
+            tempo_backend: Moteur de tempo ("rubberband", "ffmpeg", "librosa" ou "torchaudio" :
+                tous les mots étirés en un seul lot sur GPU CUDA/MPS, librosa sinon)
+            reuse_stft: Garder en cache la STFT de chaque mot (moteur librosa) pour
+                les appels suivants avec d'autres paramètres de tempo
+            mp3_quality: Qualité VBR de LAME (0 = meilleure/lente, 9 = rapide) ;
+                None pour un encodage CBR 192k
             
         Returns:
             Le chemin du fichier généré
         """
         if not composed_sentence.words:
             raise ValueError("Aucun mot à mixer")
+        if tempo_backend not in TEMPO_BACKENDS:
+            raise ValueError(f"Moteur de tempo inconnu: {tempo_backend} (disponibles: {', '.join(TEMPO_BACKENDS)})")
         
         print(f"🎬 Génération audio mixé - Mode: {fade_mode}, Tempo: {tempo_factor}x")
         
@@ -441,11 +964,32 @@ class MixPlayer:
         
         segments = []
         
+        # Décoder en parallèle les extraits de tous les mots
+        self._prefetch_word_windows(composed_sentence.words, word_padding)
+        
+        # Étirement de tous les mots en un seul lot sur GPU si demandé
+        if tempo_backend == "torchaudio" and not _is_unit_tempo(tempo_factor):
+            if self._get_tempo_device() != "cpu":
+                stretched = self._torchaudio_tempo_batch(
+                    [self._extract_word_segment(word, word_padding)[0] for word in composed_sentence.words],
+                    tempo_factor
+                )
+            else:
+                print("⚠️ Aucun GPU CUDA/MPS disponible pour torchaudio, repli sur librosa")
+                stretched = None
+            
+            if stretched is None:
+                tempo_backend = "librosa"
+        
         # Traiter chaque mot avec les nouveaux paramètres
         for i, word in enumerate(composed_sentence.words):
-            segment = self._process_word_segment(
-                word, word_padding, normalize_volume, fade_mode, tempo_factor, preserve_pitch
-            )
+            if tempo_backend == "torchaudio" and not _is_unit_tempo(tempo_factor):
+                segment = self._apply_word_effects(stretched[i], normalize_volume, fade_mode)
+            else:
+                segment = self._process_word_segment(
+                    word, word_padding, normalize_volume, fade_mode, tempo_factor, preserve_pitch,
+                    tempo_backend, reuse_stft
+                )
             segments.append(segment)
             print(f"  • Mot {i+1}/{len(composed_sentence.words)}: '{word.word.strip()}' ({len(segment)/1000:.2f}s)")
         
@@ -462,11 +1006,19 @@ class MixPlayer:
         if normalize_volume:
             mixed_audio = mixed_audio.normalize(headroom=10.0)
         
+        self.last_rendered_pcm = (
+            np.frombuffer(mixed_audio.raw_data, dtype=np.int16).reshape(-1, mixed_audio.channels),
+            mixed_audio.frame_rate
+        )
+        
         # Exporter le fichier final
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        mixed_audio.export(output_path, format="mp3", bitrate="192k")
+        if mp3_quality is None:
+            mixed_audio.export(output_path, format="mp3", bitrate="192k")
+        else:
+            mixed_audio.export(output_path, format="mp3", parameters=["-q:a", str(mp3_quality)])
         
         print(f"✅ Audio mixé généré: {output_path}")
         print(f"📊 Durée finale: {len(mixed_audio) / 1000:.2f}s")
@@ -476,24 +1028,53 @@ class MixPlayer:
         
         return str(output_path)
     
+    def play_audio(self, file_path: str, pcm: Optional[Tuple[np.ndarray, int]] = None) -> bool:
+        """
+        Joue un rendu : directement depuis la mémoire avec sounddevice si les échantillons
+        sont fournis, sinon via afplay (macOS).
+        
+        Args:
+            file_path: Chemin du fichier MP3 généré
+            pcm: Échantillons et fréquence du rendu (voir last_rendered_pcm)
+            
+        Returns:
+            True si la lecture a eu lieu
+        """
+        if pcm is not None and SOUNDDEVICE_AVAILABLE:
+            samples, frame_rate = pcm
+            sounddevice.play(samples, frame_rate)
+            sounddevice.wait()
+            return True
+        
+        import platform
+        if platform.system() == "Darwin":  # macOS
+            subprocess.run(["afplay", str(file_path)])
+            return True
+        
+        return False
+    
     def _process_word_segment(self, word: WordMatch, padding: float, normalize: bool,
-                            fade_mode: str, tempo_factor: float, preserve_pitch: bool) -> AudioSegment:
+                            fade_mode: str, tempo_factor: float, preserve_pitch: bool,
+                            tempo_backend: str = "rubberband", reuse_stft: bool = False) -> AudioSegment:
         """Traite un segment de mot avec tous les effets."""
-        # Charger l'audio source
-        audio = self._load_audio_file(word.audio_path)
-        
-        # Calculer les limites avec padding
-        padding_ms = int(padding * 1000)
-        start_ms = max(0, int(word.start * 1000) - padding_ms)
-        end_ms = min(len(audio), int(word.end * 1000) + padding_ms)
+        segment, start_ms, end_ms = self._extract_word_segment(word, padding)
         
-        # Extraire le segment
-        segment = audio[start_ms:end_ms]
+        # Ajuster le tempo si nécessaire (tempo 1.0 : aucun aller-retour STFT ni appel externe)
+        if not _is_unit_tempo(tempo_factor):
+            stft_key = (word.audio_path, start_ms, end_ms) if reuse_stft else None
+            segment = self._change_tempo(segment, tempo_factor, preserve_pitch, tempo_backend, stft_key)
         
-        # Ajuster le tempo si nécessaire
-        if tempo_factor != 1.0:
-            segment = self._change_tempo(segment, tempo_factor, preserve_pitch)
+        return self._apply_word_effects(segment, normalize, fade_mode)
+    
+    def _extract_word_segment(self, word: WordMatch, padding: float) -> Tuple[AudioSegment, int, int]:
+        """Extrait le segment d'un mot avec son padding (et ses bornes en ms)."""
+        audio_path, start_ms, end_ms = self._word_window(word, padding)
         
+        # Décoder uniquement la fenêtre du mot
+        return self._load_word_window(audio_path, start_ms, end_ms), start_ms, end_ms
+    
+    def _apply_word_effects(self, segment: AudioSegment, normalize: bool, fade_mode: str) -> AudioSegment:
+        """Applique la normalisation et le fondu d'un segment de mot."""
         # Normalisation
         if normalize:
             segment = segment.normalize(headroom=20.0)
@@ -503,65 +1084,204 @@ class MixPlayer:
             # Fade beaucoup plus long et progressif
             fade_duration = min(300, len(segment) // 2)  # Jusqu'à 300ms, ou la moitié du segment
             if len(segment) > fade_duration * 2:
-                segment = segment.fade_in(fade_duration).fade_out(fade_duration)
+                segment = _fade_in_out(segment, fade_duration)
         elif fade_mode == "seamless":
             # Fade très court pour préserver la parole
             fade_duration = min(15, len(segment) // 10)
             if len(segment) > fade_duration * 2:
-                segment = segment.fade_in(fade_duration).fade_out(fade_duration)
+                segment = _fade_in_out(segment, fade_duration)
         else:  # standard
             fade_duration = min(50, len(segment) // 4)
             if len(segment) > fade_duration * 2:
-                segment = segment.fade_in(fade_duration).fade_out(fade_duration)
+                segment = _fade_in_out(segment, fade_duration)
         
         return segment
     
-    def _change_tempo(self, segment: AudioSegment, factor: float, preserve_pitch: bool) -> AudioSegment:
+    def _change_tempo(self, segment: AudioSegment, factor: float, preserve_pitch: bool,
+                      backend: str = "rubberband", stft_key: Optional[Tuple] = None) -> AudioSegment:
         """Change le tempo d'un segment audio."""
+        if _is_unit_tempo(factor):
+            return segment
+        
+        if backend == "rubberband" and PYRUBBERBAND_AVAILABLE:
+            try:
+                return self._rubberband_tempo(segment, factor)
+            except Exception as e:
+                print(f"⚠️ rubberband indisponible ({e}), repli sur ffmpeg atempo")
+                backend = "ffmpeg"
+        
+        if backend in ("rubberband", "ffmpeg"):
+            try:
+                return self._ffmpeg_tempo(segment, factor)
+            except Exception as e:
+                print(f"⚠️ Erreur ffmpeg atempo: {e}, repli sur librosa")
+        
+        return self._librosa_tempo(segment, factor, preserve_pitch, stft_key)
+    
+    def _get_tempo_device(self) -> str:
+        """Détermine le meilleur dispositif pour l'étirement torchaudio."""
+        if self._tempo_device is None:
+            if not TORCHAUDIO_AVAILABLE:
+                self._tempo_device = "cpu"
+                return self._tempo_device
+            
+            import torch
+            # Vérifier si MPS (Metal Performance Shaders) est disponible sur Mac
+            if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
+                self._tempo_device = "mps"  # GPU Apple Silicon
+            # Vérifier CUDA pour les GPU NVIDIA
+            elif torch.cuda.is_available():
+                self._tempo_device = "cuda"
+            else:
+                self._tempo_device = "cpu"
+        
+        return self._tempo_device
+    
+    def _torchaudio_tempo_batch(self, segments: List[AudioSegment], factor: float) -> Optional[List[AudioSegment]]:
+        """
+        Change le tempo de tous les segments en un seul lot sur GPU
+        (Spectrogram → TimeStretch → InverseSpectrogram).
+        
+        Returns:
+            Les segments étirés (mono), ou None en cas d'erreur
+        """
+        try:
+            import torch
+            import torchaudio
+            
+            device = self._get_tempo_device()
+            frame_rate = segments[0].frame_rate
+            
+            # Segments mono au même taux, complétés par des zéros dans un tenseur [N, max_len]
+            waves = [
+                np.frombuffer(_resample_segment(seg, frame_rate).set_channels(1).set_sample_width(2).raw_data,
+                              dtype="<i2")
+                for seg in segments
+            ]
+            lengths = [len(w) for w in waves]
+            batch = np.zeros((len(waves), max(lengths)), dtype=np.float32)
+            for i, w in enumerate(waves):
+                batch[i, :len(w)] = w / 32768.0
+            
+            n_freq = GPU_STFT_N_FFT // 2 + 1
+            spectrogram = torchaudio.transforms.Spectrogram(
+                n_fft=GPU_STFT_N_FFT, hop_length=GPU_STFT_HOP_LENGTH, power=None
+            ).to(device)
+            time_stretch = torchaudio.transforms.TimeStretch(
+                hop_length=GPU_STFT_HOP_LENGTH, n_freq=n_freq
+            ).to(device)
+            inverse = torchaudio.transforms.InverseSpectrogram(
+                n_fft=GPU_STFT_N_FFT, hop_length=GPU_STFT_HOP_LENGTH
+            ).to(device)
+            
+            with torch.no_grad():
+                spec = spectrogram(torch.from_numpy(batch).to(device))
+                stretched = inverse(time_stretch(spec, factor))
+            stretched = stretched.cpu().numpy()
+            
+            results = []
+            for i, length in enumerate(lengths):
+                y = stretched[i, :int(round(length / factor))]
+                samples = np.clip(np.round(y * 32768.0), -32768, 32767).astype("<i2")
+                results.append(AudioSegment(
+                    data=samples.tobytes(),
+                    sample_width=2,
+                    frame_rate=frame_rate,
+                    channels=1
+                ))
+            
+            return results
+            
+        except Exception as e:
+            print(f"⚠️ Erreur étirement torchaudio: {e}")
+            return None
+    
+    def _rubberband_tempo(self, segment: AudioSegment, factor: float) -> AudioSegment:
+        """Change le tempo en mémoire avec Rubber Band (WSOLA/R3, adapté à la parole)."""
+        segment = segment.set_sample_width(2)
+        scale = float(1 << 15)
+        y = np.frombuffer(segment.raw_data, dtype="<i2").reshape(-1, segment.channels).astype(np.float32) / scale
+        
+        y_stretched = pyrubberband.time_stretch(y, segment.frame_rate, rate=factor)
+        samples = np.clip(np.round(y_stretched * scale), -scale, scale - 1).astype("<i2")
+        
+        return AudioSegment(
+            data=samples.tobytes(),
+            sample_width=2,
+            frame_rate=segment.frame_rate,
+            channels=segment.channels
+        )
+    
+    def _ffmpeg_tempo(self, segment: AudioSegment, factor: float) -> AudioSegment:
+        """Change le tempo via le filtre atempo de ffmpeg (PCM brut par tubes, sans fichiers temporaires)."""
+        segment = segment.set_sample_width(2)
+        
+        # atempo est limité à [0.5, 2.0] par instance : chaîner les filtres au besoin
+        filters = []
+        remaining = factor
+        while remaining < 0.5 or remaining > 2.0:
+            step = 0.5 if remaining < 0.5 else 2.0
+            filters.append(f"atempo={step}")
+            remaining /= step
+        filters.append(f"atempo={remaining:.6f}")
+        
+        pcm_format = ["-f", "s16le", "-ar", str(segment.frame_rate), "-ac", str(segment.channels)]
+        cmd = ["ffmpeg", "-v", "error", *pcm_format, "-i", "pipe:0",
+               "-filter:a", ",".join(filters), *pcm_format, "pipe:1"]
+        result = subprocess.run(cmd, input=segment.raw_data, stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE, check=True)
+        
+        return AudioSegment(
+            data=result.stdout,
+            sample_width=2,
+            frame_rate=segment.frame_rate,
+            channels=segment.channels
+        )
+    
+    def _librosa_tempo(self, segment: AudioSegment, factor: float, preserve_pitch: bool,
+                       stft_key: Optional[Tuple] = None) -> AudioSegment:
+        """
+        Change le tempo avec le vocodeur de phase de librosa.
+        
+        La STFT du segment est calculée une seule fois par clé et réutilisée :
+        chaque variante de tempo ne paie que le vocodeur de phase et l'ISTFT.
+        """
         try:
             import librosa
-            import numpy as np
-            import soundfile as sf
-            import tempfile
-            import os
-            
-            # Méthode alternative plus robuste avec fichiers temporaires
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_input:
-                with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_output:
-                    try:
-                        # Exporter le segment vers un fichier temporaire
-                        segment.export(temp_input.name, format="wav")
-                        temp_input.flush()
-                        
-                        # Charger avec librosa
-                        y, sr = librosa.load(temp_input.name, sr=None)
-                        
-                        if preserve_pitch:
-                            # Changer seulement le tempo, préserver le pitch
-                            y_stretched = librosa.effects.time_stretch(y, rate=factor)
-                        else:
-                            # Changer tempo et pitch ensemble (simple resample)
-                            y_stretched = librosa.effects.time_stretch(y, rate=factor)
-                        
-                        # Sauvegarder le résultat
-                        sf.write(temp_output.name, y_stretched, sr)
-                        
-                        # Recharger en AudioSegment
-                        new_segment = AudioSegment.from_wav(temp_output.name)
-                        
-                        return new_segment
-                        
-                    finally:
-                        # Nettoyer les fichiers temporaires
-                        try:
-                            os.unlink(temp_input.name)
-                            os.unlink(temp_output.name)
-                        except:
-                            pass
+            
+            # Segment mono en flottants (comme librosa.load)
+            mono = segment.set_channels(1).set_sample_width(2)
+            n_samples = len(mono.raw_data) // 2
+            
+            cache_key = stft_key + (STFT_N_FFT, STFT_HOP_LENGTH) if stft_key is not None else None
+            D = self._word_stft_cache.get(cache_key) if cache_key is not None else None
+            if D is not None:
+                self._word_stft_cache.move_to_end(cache_key)
+            else:
+                y = np.frombuffer(mono.raw_data, dtype="<i2").astype(np.float32) / 32768.0
+                D = librosa.stft(y, n_fft=STFT_N_FFT, hop_length=STFT_HOP_LENGTH)
+                if cache_key is not None:
+                    self._word_stft_cache[cache_key] = D
+                    if len(self._word_stft_cache) > STFT_CACHE_SIZE:
+                        self._word_stft_cache.popitem(last=False)
+            
+            # Le pitch est préservé dans les deux cas (vocodeur de phase)
+            D_stretched = librosa.phase_vocoder(D, rate=factor, hop_length=STFT_HOP_LENGTH)
+            y_stretched = librosa.istft(D_stretched, hop_length=STFT_HOP_LENGTH,
+                                        length=int(round(n_samples / factor)))
+            
+            samples = np.clip(np.round(y_stretched * 32768.0), -32768, 32767).astype("<i2")
+            
+            return AudioSegment(
+                data=samples.tobytes(),
+                sample_width=2,
+                frame_rate=mono.frame_rate,
+                channels=1
+            )
             
         except ImportError:
-            print("⚠️ librosa/soundfile non disponible, tempo inchangé")
-            print("📦 Installation: pip install librosa soundfile")
+            print("⚠️ librosa non disponible, tempo inchangé")
+            print("📦 Installation: pip install librosa")
             return segment
         except Exception as e:
             print(f"⚠️ Erreur changement tempo: {e}, tempo inchangé")
@@ -570,60 +1290,75 @@ class MixPlayer:
     def _standard_assembly(self, segments: List[AudioSegment], gap_duration: float, 
                          crossfade_duration: int) -> AudioSegment:
         """Assemblage standard avec silences et crossfade simple."""
-        gap_silence = AudioSegment.silent(duration=int(gap_duration * 1000))
-        mixed_audio = segments[0]
-        
-        for segment in segments[1:]:
-            mixed_audio = mixed_audio + gap_silence
-            
-            if crossfade_duration > 0 and len(mixed_audio) > crossfade_duration and len(segment) > crossfade_duration:
-                mixed_audio = mixed_audio.append(segment, crossfade=crossfade_duration)
-            else:
-                mixed_audio = mixed_audio + segment
-        
-        return mixed_audio
+        return self._assemble_segments(
+            segments, int(gap_duration * 1000), crossfade_duration, FADE_FUNCS["standard"]
+        )
     
     def _artistic_assembly(self, segments: List[AudioSegment], gap_duration: float,
                          crossfade_duration: int) -> AudioSegment:
         """Assemblage artistique avec fondus longs et chevauchements."""
-        mixed_audio = segments[0]
+        # Fondu artistique beaucoup plus long
+        artistic_crossfade = max(crossfade_duration, 400)  # Au moins 400ms
+        gap_ms = max(0, int(gap_duration * 1000) - artistic_crossfade)
         
-        for segment in segments[1:]:
-            # Fondu artistique beaucoup plus long
-            artistic_crossfade = max(crossfade_duration, 400)  # Au moins 400ms
-            gap_silence = AudioSegment.silent(duration=max(0, int(gap_duration * 1000) - artistic_crossfade))
-            
-            if len(gap_silence) > 0:
-                mixed_audio = mixed_audio + gap_silence
-            
-            # Chevauchement artistique long
-            if len(mixed_audio) > artistic_crossfade and len(segment) > artistic_crossfade:
-                mixed_audio = mixed_audio.append(segment, crossfade=artistic_crossfade)
-            else:
-                mixed_audio = mixed_audio + segment
-        
-        return mixed_audio
+        return self._assemble_segments(segments, gap_ms, artistic_crossfade, FADE_FUNCS["artistic"])
     
     def _seamless_assembly(self, segments: List[AudioSegment], gap_duration: float,
                          crossfade_duration: int) -> AudioSegment:
         """Assemblage seamless avec fondus courts et gaps minimaux."""
-        mixed_audio = segments[0]
+        # Gap minimal pour le mode seamless
+        minimal_gap = max(50, int(gap_duration * 1000) // 3)
+        
+        # Crossfade court mais présent
+        seamless_crossfade = min(crossfade_duration, 30)
+        
+        return self._assemble_segments(segments, minimal_gap, seamless_crossfade, FADE_FUNCS["seamless"])
+    
+    def _assemble_segments(self, segments: List[AudioSegment], gap_ms: int, crossfade_ms: int,
+                           fade_func) -> AudioSegment:
+        """
+        Assemble les segments dans un tampon NumPy unique : silence entre chaque mot,
+        puis chevauchement de crossfade_ms entre la fin du montage et le mot suivant.
         
-        for segment in segments[1:]:
-            # Gap minimal pour le mode seamless
-            minimal_gap = max(50, int(gap_duration * 1000) // 3)
-            gap_silence = AudioSegment.silent(duration=minimal_gap)
+        Évite les concaténations pydub successives (recopie de tout le montage à chaque mot).
+        """
+        # Format commun le plus riche des segments, comme la synchronisation de pydub (16 bits)
+        frame_rate = max(seg.frame_rate for seg in segments)
+        channels = max(seg.channels for seg in segments)
+        arrays = [
+            np.frombuffer(
+                _resample_segment(seg, frame_rate).set_channels(channels).set_sample_width(2).raw_data,
+                dtype=np.int16
+            ).reshape(-1, channels)
+            for seg in segments
+        ]
+        
+        gap_frames = gap_ms * frame_rate // 1000
+        crossfade_frames = crossfade_ms * frame_rate // 1000
+        
+        buffer = np.zeros((sum(len(a) for a in arrays) + gap_frames * (len(arrays) - 1), channels),
+                          dtype=np.int16)
+        buffer[:len(arrays[0])] = arrays[0]
+        cursor = len(arrays[0])
+        
+        for samples in arrays[1:]:
+            # Silence (déjà à zéro dans le tampon)
+            cursor += gap_frames
             
-            mixed_audio = mixed_audio + gap_silence
+            if crossfade_frames > 0 and cursor > crossfade_frames and len(samples) > crossfade_frames:
+                start = cursor - crossfade_frames
+                buffer[start:cursor] = fade_func(buffer[start:cursor], samples[:crossfade_frames])
+                samples = samples[crossfade_frames:]
             
-            # Crossfade court mais présent
-            seamless_crossfade = min(crossfade_duration, 30)
-            if len(mixed_audio) > seamless_crossfade and len(segment) > seamless_crossfade:
-                mixed_audio = mixed_audio.append(segment, crossfade=seamless_crossfade)
-            else:
-                mixed_audio = mixed_audio + segment
-        
-        return mixed_audio
+            buffer[cursor:cursor + len(samples)] = samples
+            cursor += len(samples)
+        
+        return AudioSegment(
+            data=buffer[:cursor].tobytes(),
+            sample_width=2,
+            frame_rate=frame_rate,
+            channels=channels
+        )
     
     def get_word_statistics(self) -> Dict[str, Any]:
         """
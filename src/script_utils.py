@@ -0,0 +1,43 @@
+"""
+Utilitaires partagés par les scripts d'exemple et de test.
+"""
+
+import contextlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def load_json(json_path: Union[str, Path]) -> Dict[str, Any]:
+    """Charge un fichier JSON, avec orjson si disponible (parseur SIMD plus rapide)"""
+    if ORJSON_AVAILABLE:
+        with open(json_path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def run_quiet(test_func: Callable[..., bool], **kwargs) -> None:
+    """
+    Mode batch (CI, mesures) : lance test_func(quiet=True, ...) sortie standard ignorée,
+    puis quitte le processus.
+
+    Les messages d'erreur des scripts sont écrits sur stderr et restent visibles ;
+    le code de sortie est non nul si test_func signale un échec (retour False).
+
+    Args:
+        test_func: Fonction de test acceptant quiet et retournant True en cas de succès
+        **kwargs: Arguments supplémentaires de test_func
+    """
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        success = test_func(quiet=True, **kwargs)
+    sys.exit(0 if success else 1)
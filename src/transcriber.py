@@ -8,8 +8,9 @@ import librosa
 import numpy as np
 import torch
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pyannote.audio import Pipeline
 from pyannote.audio.pipelines.speaker_verification import PretrainedSpeakerEmbedding
 import warnings
@@ -58,6 +59,16 @@ class AudioTranscriber:
             self.model = whisper.load_model(self.model_name, device="cpu")
             self.actual_device = "cpu"
             print("✅ Modèle chargé sur CPU !")
+        
+        # Demi-précision sur GPU : transcribe(fp16=True) exécute la passe avant en float16,
+        # les poids restent en float32 (LayerNorm de Whisper calcule en float32)
+        self.fp16 = self.actual_device in ("cuda", "mps")
+        if self.actual_device == "cuda":
+            # TF32 pour les produits matriciels restés en float32
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.backends.cudnn.allow_tf32 = True
+        elif self.actual_device == "cpu":
+            print("🐢 Transcription sur CPU en float32 : chemin le plus lent")
     
     def _get_optimal_device(self):
         """Détermine le meilleur dispositif disponible."""
@@ -122,6 +133,72 @@ class AudioTranscriber:
         # Obtenir les informations audio
         audio_info = self.get_audio_info(audio_path)
         
+        return self._transcribe_audio(audio_path, audio_info, word_timestamps)
+    
+    def transcribe_batch(
+        self,
+        audio_paths: List[str],
+        word_timestamps: bool = True,
+        batch_size: int = 4
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Transcrit une liste de fichiers audio avec des timecodes précis.
+        
+        Le décodage et l'analyse des fichiers suivants (ffmpeg, librosa) se font en
+        arrière-plan pendant que le modèle transcrit le fichier courant : le GPU
+        n'attend plus la préparation de chaque fichier.
+        
+        Args:
+            audio_paths: Chemins vers les fichiers audio
+            word_timestamps: Si True, inclut les timecodes au niveau des mots
+            batch_size: Nombre de fichiers préparés à l'avance
+            
+        Returns:
+            Les résultats structurés, dans l'ordre des fichiers (None en cas d'erreur)
+        """
+        if self.model is None:
+            self._load_model()
+        
+        def prepare(audio_path: str):
+            return self.get_audio_info(audio_path), whisper.load_audio(audio_path)
+        
+        results = []
+        with ThreadPoolExecutor(max_workers=max(1, batch_size)) as executor:
+            # Fenêtre glissante de fichiers en préparation
+            pending = [executor.submit(prepare, path) for path in audio_paths[:batch_size]]
+            
+            for i, audio_path in enumerate(audio_paths):
+                if i + batch_size < len(audio_paths):
+                    pending.append(executor.submit(prepare, audio_paths[i + batch_size]))
+                
+                print(f"🎵 Transcription {i + 1}/{len(audio_paths)}: {Path(audio_path).name}")
+                try:
+                    audio_info, audio = pending[i].result()
+                    results.append(self._transcribe_audio(audio, audio_info, word_timestamps))
+                except Exception as e:
+                    print(f"❌ Erreur lors du traitement de {Path(audio_path).name} : {str(e)}")
+                    results.append(None)
+                pending[i] = None  # Libérer l'audio décodé
+        
+        return results
+    
+    def _transcribe_audio(
+        self,
+        audio: Union[str, np.ndarray],
+        audio_info: Dict[str, Any],
+        word_timestamps: bool
+    ) -> Dict[str, Any]:
+        """
+        Transcrit un audio (chemin ou échantillons 16 kHz déjà décodés) et structure le résultat.
+        
+        Args:
+            audio: Chemin vers le fichier audio ou échantillons décodés par whisper.load_audio
+            audio_info: Métadonnées du fichier (voir get_audio_info)
+            word_timestamps: Si True, inclut les timecodes au niveau des mots
+            
+        Returns:
+            Dictionnaire structuré avec la transcription et les métadonnées
+        """
         print("🎯 Analyse et transcription en cours...")
         
         try:
@@ -129,11 +206,12 @@ class AudioTranscriber:
             options = {
                 "language": self.language,
                 "word_timestamps": word_timestamps,
-                "verbose": False
+                "verbose": False,
+                "fp16": self.fp16
             }
             
             # Effectuer la transcription
-            result = self.model.transcribe(audio_path, **options)
+            result = self.model.transcribe(audio, **options)
             
             # Structurer les résultats
             structured_result = {